@@ -3,29 +3,46 @@ App-wide configuration and settings.
 
 Settings can be changed at runtime via the web UI (/settings).
 They persist in a JSON file so they survive restarts.
+
+The parsed file is cached in memory as a typed, immutable Settings
+snapshot and only re-read when its modification time changes (or after
+save_settings()), so hot paths can call get() / load_settings() freely.
 """
 
 import os
 import json
+import mmap
+from dataclasses import asdict, dataclass
+
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works fine
+    orjson = None
 
 SETTINGS_FILE = "slippa_settings.json"
 
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Typed snapshot of all settings. Field defaults are the app defaults."""
+    whisper_model: str = "base"
+    min_clip_duration: int = 15
+    max_clip_duration: int = 90
+    target_clip_duration: int = 45
+    max_clips: int = 10
+    default_privacy: str = "private"
+    download_dir: str = "downloads"
+    clips_dir: str = "clips"
+    smart_edit: bool = True
+    gap_threshold: float = 0.8
+    output_format: str = "horizontal"  # "horizontal" | "vertical" | "both"
+    smart_scoring: bool = True          # NLP-powered clip scoring
+    auto_titles: bool = True            # Auto-generate clip titles from transcript
+    batch_concurrency: int = 3          # Batch videos processed at the same time
+
+
 # Defaults
-DEFAULTS = {
-    "whisper_model": "base",
-    "min_clip_duration": 15,
-    "max_clip_duration": 90,
-    "target_clip_duration": 45,
-    "max_clips": 10,
-    "default_privacy": "private",
-    "download_dir": "downloads",
-    "clips_dir": "clips",
-    "smart_edit": True,
-    "gap_threshold": 0.8,
-    "output_format": "horizontal",  # "horizontal" | "vertical" | "both"
-    "smart_scoring": True,           # NLP-powered clip scoring
-    "auto_titles": True,             # Auto-generate clip titles from transcript
-}
+DEFAULTS = asdict(Settings())
 
 # Available Whisper models for the settings UI
 WHISPER_MODELS = [
@@ -37,25 +54,101 @@ WHISPER_MODELS = [
 ]
 
 
-def load_settings() -> dict:
-    """Load settings from disk, falling back to defaults."""
-    settings = DEFAULTS.copy()
-    if os.path.exists(SETTINGS_FILE):
+def _read_file() -> dict:
+    """
+    Read and parse the settings file.
+
+    With orjson, the file is memory-mapped and parsed straight from the
+    mapping, skipping the intermediate read buffer.
+    """
+    with open(SETTINGS_FILE, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+
+
+def _dumps(settings: dict) -> bytes:
+    """Serialize settings as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2).encode("utf-8")
+
+
+def _from_saved(saved: dict) -> Settings:
+    """
+    Merge saved values over the defaults.
+
+    Unknown keys are dropped, and a value whose type doesn't match its
+    default (e.g. a hand-edited "max_clips": "5") keeps the default.
+    """
+    values = {}
+    for key, default in DEFAULTS.items():
+        if key not in saved:
+            continue
+        value = saved[key]
+        if type(default) is float and type(value) is int:
+            value = float(value)
+        if type(value) is type(default):
+            values[key] = value
+    return Settings(**values)
+
+
+# In-memory cache of the merged settings, keyed on the file's mtime
+_CACHED = None
+_CACHED_MTIME = None
+
+
+def _file_mtime():
+    """Return the settings file's mtime, or None if it doesn't exist."""
+    try:
+        return os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_cached() -> Settings:
+    """Return the cached settings, re-reading the file if it changed."""
+    global _CACHED, _CACHED_MTIME
+
+    mtime = _file_mtime()
+    if _CACHED is not None and mtime == _CACHED_MTIME:
+        return _CACHED
+
+    saved = {}
+    if mtime is not None:
         try:
-            with open(SETTINGS_FILE, "r") as f:
-                saved = json.load(f)
-            settings.update(saved)
-        except (json.JSONDecodeError, IOError):
+            saved = _read_file()
+        except (ValueError, IOError):  # bad JSON or empty file
             pass
+    settings = _from_saved(saved if isinstance(saved, dict) else {})
+
+    _CACHED = settings
+    _CACHED_MTIME = mtime
     return settings
 
 
+def load_settings() -> dict:
+    """Load settings from disk, falling back to defaults.
+
+    Returns a fresh dict, so callers are free to mutate it.
+    """
+    settings = _load_cached()
+    return {key: getattr(settings, key) for key in DEFAULTS}
+
+
 def save_settings(settings: dict):
     """Save settings to disk."""
-    with open(SETTINGS_FILE, "w") as f:
-        json.dump(settings, f, indent=2)
+    global _CACHED, _CACHED_MTIME
+
+    with open(SETTINGS_FILE, "wb") as f:
+        f.write(_dumps(settings))
+
+    _CACHED = _from_saved(settings)
+    _CACHED_MTIME = _file_mtime()
 
 
 def get(key: str):
-    """Get a single setting value."""
-    return load_settings().get(key, DEFAULTS.get(key))
+    """Get a single setting value (None for unknown keys)."""
+    return getattr(_load_cached(), key, None)
@@ -5,3 +5,7 @@ Runs 100% locally using Whisper for transcription and ffmpeg for cutting.
 
 __version__ = "0.1.0"
 __app_name__ = "Slippa"
+
+# Sources starting with one of these are downloaded; anything else is a
+# local path. Kept here so the CLI can check without importing yt-dlp.
+URL_PREFIXES = ("http://", "https://", "www.")
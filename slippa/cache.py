@@ -0,0 +1,82 @@
+"""
+Cache module — on-disk cache of pipeline stage outputs.
+
+Submitting the same video again (common in batches and retries) can skip
+the download, transcription and clip analysis whose results are already
+cached. Each entry is a small JSON file named by a SHA-256 of its key, so
+entries are shared by every worker process and survive restarts.
+
+Entries expire after MAX_AGE seconds; stale or unreadable entries are
+treated as misses.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works fine
+    orjson = None
+
+
+CACHE_DIR = ".slippa_cache"
+MAX_AGE = 30 * 24 * 3600  # 30 days
+
+
+def make_key(*parts) -> str:
+    """Build a cache key from JSON-serializable parts."""
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def file_key(path: str) -> list:
+    """Identity of a file's current contents: path, size and mtime."""
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+
+def get(namespace: str, key: str):
+    """Return the cached value, or None on a miss or expired entry."""
+    path = _entry_path(namespace, key)
+    try:
+        if time.time() - os.stat(path).st_mtime > MAX_AGE:
+            os.remove(path)
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:  # truncated / corrupt entry
+        return None
+
+
+def put(namespace: str, key: str, value):
+    """Store a JSON-serializable value. Writes are atomic (temp + rename)."""
+    path = _entry_path(namespace, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if orjson is not None:
+        data = orjson.dumps(value)
+    else:
+        data = json.dumps(value).encode("utf-8")
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _entry_path(namespace: str, key: str) -> str:
+    return os.path.join(CACHE_DIR, namespace, f"{key}.json")
@@ -8,11 +8,10 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
-from slippa import __version__, __app_name__
-from slippa.downloader import download_video
-from slippa.transcriber import transcribe_audio
-from slippa.clipper import find_clips
-from slippa.cutter import cut_clips
+from slippa import __version__, __app_name__, URL_PREFIXES
+
+# Pipeline modules (yt-dlp, faster-whisper, TextBlob) are imported inside
+# main() right before use, so the banner and input prompt show up instantly.
 
 
 console = Console()
@@ -43,9 +42,11 @@ def main():
 
     # Step 2: Download or validate video
     console.print()
-    if source.startswith(("http://", "https://", "www.")):
+    if source.startswith(URL_PREFIXES):
+        from slippa.downloader import download_video
+
         console.print("[yellow]📥 Downloading video from YouTube...[/yellow]")
-        video_path = download_video(source)
+        video_path = download_video(source).path
     else:
         if not os.path.exists(source):
             console.print(f"[red]File not found: {source}[/red]")
@@ -55,12 +56,16 @@ def main():
     console.print(f"[green]✅ Video ready:[/green] {video_path}")
 
     # Step 3: Transcribe
+    from slippa.transcriber import transcribe_audio
+
     console.print()
     console.print("[yellow]🎤 Transcribing audio (this may take a while)...[/yellow]")
     transcription = transcribe_audio(video_path)
     console.print(f"[green]✅ Transcription complete![/green] ({len(transcription)} segments)")
 
     # Step 4: Find clips
+    from slippa.clipper import find_clips
+
     console.print()
     console.print("[yellow]🧠 Analyzing transcript for clip-worthy moments...[/yellow]")
     clips = find_clips(transcription)
@@ -83,6 +88,8 @@ def main():
     # Step 5: Cut clips
     console.print()
     if Confirm.ask(f"Cut these {len(clips)} clips?", default=True):
+        from slippa.cutter import cut_clips
+
         console.print("[yellow]✂️  Cutting clips...[/yellow]")
         clip_paths = cut_clips(video_path, clips)
         console.print(f"[green]✅ Saved {len(clip_paths)} clips to [bold]clips/[/bold][/green]")
@@ -7,8 +7,9 @@ segments) and decides which parts of the video would make good clips.
 Smart scoring (Phase 4):
     NLP-powered clip selection using the scorer module:
     1. Group consecutive transcript segments into candidate clips.
-    2. Score each candidate using engagement, emotion, coherence,
-       and virality analysis (via scorer.py).
+    2. Rank the candidates by word/segment density and score them, best
+       first, using engagement, emotion, coherence, and virality analysis
+       (via scorer.py) until enough non-overlapping clips are found.
     3. Return the top N highest-scoring candidates with labels.
 
     Falls back to legacy word-density scoring if smart_scoring=False.
@@ -20,7 +21,13 @@ Smart editing (Phase 3):
     - The cutter merges these sub-segments into a single tight clip.
 """
 
-from slippa.scorer import score_engagement
+import heapq
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from operator import itemgetter
+
+from slippa.scorer import score_engagement_batch
 
 
 # Clip length preferences (in seconds)
@@ -31,12 +38,16 @@ TARGET_CLIP_DURATION = 45
 # How many clips to return
 MAX_CLIPS = 10
 
+# Smart scoring NLP-scores candidates in slices of this many per requested
+# clip, in order of the cheap legacy density score
+SMART_PREFILTER_FACTOR = 10
+
 # Smart editing defaults
 DEFAULT_GAP_THRESHOLD = 0.8  # seconds of silence to remove
 
 
 def find_clips(
-    segments: list[dict],
+    segments: Iterable[dict],
     min_duration: float = MIN_CLIP_DURATION,
     max_duration: float = MAX_CLIP_DURATION,
     max_clips: int = MAX_CLIPS,
@@ -48,8 +59,10 @@ def find_clips(
     Analyze transcript segments and find the best clips.
 
     Args:
-        segments: List of transcript segments from the transcriber.
-                  Each has "start", "end", "text", and optionally "words" keys.
+        segments: Transcript segments from the transcriber — a list, or a
+                  generator such as transcriber.iter_segments(); they're
+                  read in a single pass. Each has "start", "end", "text",
+                  and optionally "words" keys.
         min_duration: Minimum clip length in seconds.
         max_duration: Maximum clip length in seconds.
         max_clips: Maximum number of clips to return.
@@ -67,76 +80,77 @@ def find_clips(
             - "score_breakdown": dict — detailed sub-scores (only if smart_scoring)
             - "sub_segments": list[dict] — (only if smart_edit) talk-only ranges
     """
-    if not segments:
+    # Step 1: Generate candidate clip windows.
+    # One pass over the segments pulls out the columns windowing needs.
+    # Cumulative word counts give any window's word count in O(1), so a
+    # window's text is only joined when something actually needs it.
+    # Whole segments (with their word timings) are only kept for smart edit.
+    starts, ends, seg_texts, cum_words = [], [], [], [0]
+    kept_segments = [] if smart_edit else None
+    for seg in segments:
+        text = seg["text"]
+        starts.append(seg["start"])
+        ends.append(seg["end"])
+        seg_texts.append(text)
+        cum_words.append(cum_words[-1] + len(text.split()))
+        if kept_segments is not None:
+            kept_segments.append(seg)
+
+    if not starts:
         return []
 
-    # Step 1: Generate candidate clips using a sliding window
-    candidates = []
-
-    for i in range(len(segments)):
-        clip_text_parts = []
-        clip_start = segments[i]["start"]
-        clip_end = segments[i]["end"]
-
-        for j in range(i, len(segments)):
-            clip_end = segments[j]["end"]
-            clip_text_parts.append(segments[j]["text"])
-            duration = clip_end - clip_start
-
-            # If we've exceeded max duration, stop extending this window
-            if duration > max_duration:
+    # Windows are streamed as (legacy_score, first, last) tuples, never
+    # held as full candidate dicts
+    windows = _iter_windows(starts, ends, min_duration, max_duration)
+    scored = _score_windows_legacy(windows, starts, ends, cum_words)
+
+    # Steps 2-3: Score candidates, then remove overlapping clips
+    # (greedy — keep highest scored)
+    if smart_scoring:
+        # NLP scoring is the expensive part — only run it on windows the
+        # cheap legacy density score ranks highest, a slice at a time.
+        # The top windows mostly overlap one another, so keep scoring the
+        # next slice until overlap removal can fill max_clips.
+        ranked = _iter_ranked(scored)
+        candidates, selected = [], []
+        while len(selected) < max_clips:
+            batch = list(islice(ranked, max_clips * SMART_PREFILTER_FACTOR))
+            if not batch:
                 break
+            candidates.extend(
+                _smart_candidates(batch, starts, ends, seg_texts, cum_words)
+            )
+            # Score ties keep window order
+            candidates.sort(key=lambda c: (-c["score"], c["_seg_range"]))
+            selected = _remove_overlaps(candidates, max_clips)
+    else:
+        # Legacy scores are already final, so rank lazily and build candidate
+        # dicts on demand: overlap removal stops pulling as soon as it has
+        # max_clips disjoint clips. Text is joined later, for those only.
+        candidates = (
+            {
+                "start": starts[i],
+                "end": ends[j],
+                "text": None,
+                "score": score,
+                "label": "—",
+                "score_breakdown": {},
+                "segment_count": j - i + 1,
+                "_seg_range": (i, j),
+            }
+            for score, i, j in _iter_ranked(scored)
+        )
+        selected = _remove_overlaps(candidates, max_clips)
 
-            # Only consider clips that meet minimum duration
-            if duration >= min_duration:
-                combined_text = " ".join(clip_text_parts)
-                seg_count = j - i + 1
-
-                if smart_scoring:
-                    score_result = score_engagement(
-                        combined_text, duration, seg_count
-                    )
-                    candidates.append({
-                        "start": clip_start,
-                        "end": clip_end,
-                        "text": combined_text,
-                        "score": score_result["total"],
-                        "label": score_result["label"],
-                        "score_breakdown": {
-                            "engagement": score_result["engagement"],
-                            "emotion": score_result["emotion"],
-                            "coherence": score_result["coherence"],
-                            "virality": score_result["virality"],
-                        },
-                        "segment_count": seg_count,
-                        "_seg_range": (i, j),
-                    })
-                else:
-                    score = _score_clip_legacy(
-                        combined_text, duration, seg_count
-                    )
-                    candidates.append({
-                        "start": clip_start,
-                        "end": clip_end,
-                        "text": combined_text,
-                        "score": score,
-                        "label": "—",
-                        "score_breakdown": {},
-                        "segment_count": seg_count,
-                        "_seg_range": (i, j),
-                    })
-
-    # Step 2: Sort by score (highest first)
-    candidates.sort(key=lambda c: c["score"], reverse=True)
-
-    # Step 3: Remove overlapping clips (greedy — keep highest scored)
-    selected = _remove_overlaps(candidates, max_clips)
+    for clip in selected:
+        if clip["text"] is None:
+            clip["text"] = _join_text(seg_texts, *clip["_seg_range"])
 
     # Step 4: Smart editing — build sub-segments that skip silence
     if smart_edit:
         for clip in selected:
             seg_start, seg_end = clip["_seg_range"]
-            clip_segments = segments[seg_start:seg_end + 1]
+            clip_segments = kept_segments[seg_start:seg_end + 1]
             clip["sub_segments"] = _build_smart_segments(
                 clip_segments, gap_threshold
             )
@@ -151,6 +165,112 @@ def find_clips(
     return selected
 
 
+def _smart_candidates(
+    windows: list[tuple[float, int, int]],
+    starts: list[float],
+    ends: list[float],
+    seg_texts: list[str],
+    cum_words: list[int],
+) -> list[dict]:
+    """NLP-score (legacy_score, first, last) windows into candidate clip dicts."""
+    texts, durations, seg_counts, word_counts = [], [], [], []
+    for _, i, j in windows:
+        texts.append(_join_text(seg_texts, i, j))
+        durations.append(ends[j] - starts[i])
+        seg_counts.append(j - i + 1)
+        word_counts.append(cum_words[j + 1] - cum_words[i])
+
+    results = score_engagement_batch(texts, durations, seg_counts, word_counts)
+
+    candidates = []
+    for (_, i, j), text, seg_count, score_result in zip(
+        windows, texts, seg_counts, results
+    ):
+        candidates.append({
+            "start": starts[i],
+            "end": ends[j],
+            "text": text,
+            "score": score_result["total"],
+            "label": score_result["label"],
+            "score_breakdown": {
+                "engagement": score_result["engagement"],
+                "emotion": score_result["emotion"],
+                "coherence": score_result["coherence"],
+                "virality": score_result["virality"],
+            },
+            "segment_count": seg_count,
+            "_seg_range": (i, j),
+        })
+    return candidates
+
+
+def _iter_ranked(
+    scored: Iterable[tuple[float, int, int]],
+) -> Iterator[tuple[float, int, int]]:
+    """
+    Yield (score, first, last) windows from highest to lowest score (ties
+    in window order, like a stable sort), paying O(log n) per window
+    actually consumed.
+    """
+    heap = [(-score, i, j) for score, i, j in scored]
+    heapq.heapify(heap)
+    while heap:
+        neg_score, i, j = heapq.heappop(heap)
+        yield -neg_score, i, j
+
+
+def _iter_windows(
+    starts: list[float],
+    ends: list[float],
+    min_duration: float,
+    max_duration: float,
+) -> Iterator[tuple[int, int]]:
+    """Yield every (first, last) segment window within the duration limits."""
+    j_min, j_max = _window_bounds(starts, ends, min_duration, max_duration)
+    for i in range(len(starts)):
+        for j in range(j_min[i], j_max[i] + 1):
+            yield i, j
+
+
+def _window_bounds(
+    starts: list[float],
+    ends: list[float],
+    min_duration: float,
+    max_duration: float,
+) -> tuple[list[int], list[int]]:
+    """
+    For each start segment i, find the range of end segments j >= i whose
+    clip duration ends[j] - starts[i] lies within [min_duration, max_duration].
+
+    Segments are in time order, so the range for i is contiguous:
+    j_min[i]..j_max[i] (empty when j_max[i] < j_min[i]). Both bounds only
+    move forward as i grows, so one sweep finds all of them.
+
+    Durations are compared as ends[j] - starts[i], not ends[j] against
+    starts[i] + limit: the two round differently near the limits.
+    """
+    n = len(starts)
+    j_min, j_max = [], []
+    lo = hi = 0
+
+    for i in range(n):
+        lo = max(lo, i)
+        while lo < n and ends[lo] - starts[i] < min_duration:
+            lo += 1
+        hi = max(hi, i)
+        while hi < n and ends[hi] - starts[i] <= max_duration:
+            hi += 1
+        j_min.append(lo)
+        j_max.append(hi - 1)
+
+    return j_min, j_max
+
+
+def _join_text(seg_texts: list[str], first: int, last: int) -> str:
+    """Join the texts of segments first..last (inclusive)."""
+    return " ".join(seg_texts[first:last + 1])
+
+
 def _build_smart_segments(
     segments: list[dict],
     gap_threshold: float,
@@ -168,7 +288,7 @@ def _build_smart_segments(
     # Gather all words across segments
     all_words = []
     for seg in segments:
-        all_words.extend(seg.get("words", []))
+        all_words.extend(seg.get("words", ()))
 
     if not all_words:
         # No word data → fall back to a single continuous segment
@@ -192,13 +312,11 @@ def _build_smart_segments(
     return sub_segments
 
 
-def _score_clip_legacy(text: str, duration: float, segment_count: int) -> float:
+def _score_counts_legacy(word_count: int, duration: float, segment_count: int) -> float:
     """
     Legacy scoring — simple word/segment density.
     Kept as a fallback when smart_scoring is disabled.
     """
-    word_count = len(text.split())
-
     if duration <= 0:
         return 0.0
 
@@ -212,7 +330,27 @@ def _score_clip_legacy(text: str, duration: float, segment_count: int) -> float:
     return round(score, 3)
 
 
-def _remove_overlaps(candidates: list[dict], max_clips: int) -> list[dict]:
+def _score_windows_legacy(
+    windows: Iterable[tuple[int, int]],
+    starts: list[float],
+    ends: list[float],
+    cum_words: list[int],
+) -> Iterator[tuple[float, int, int]]:
+    """
+    Legacy-score a stream of (first, last) segment windows, yielding
+    (score, first, last).
+
+    Word counts come from the cum_words prefix sums, so each window costs
+    O(1) instead of re-joining and re-splitting its text.
+    """
+    for i, j in windows:
+        score = _score_counts_legacy(
+            cum_words[j + 1] - cum_words[i], ends[j] - starts[i], j - i + 1
+        )
+        yield score, i, j
+
+
+def _remove_overlaps(candidates: Iterable[dict], max_clips: int) -> list[dict]:
     """
     Remove overlapping clips, keeping the highest-scored ones.
 
@@ -222,22 +360,28 @@ def _remove_overlaps(candidates: list[dict], max_clips: int) -> list[dict]:
     3. Repeat until we have max_clips or run out of candidates.
 
     Two clips "overlap" if one starts before the other ends.
+
+    Selected clips are disjoint, so keeping their (start, end) ranges sorted
+    means only the selected clip starting closest before a candidate's end
+    can overlap it — one bisect per candidate instead of a full scan.
     """
     selected = []
+    taken = []  # sorted (start, end) of selected clips
+
+    if max_clips <= 0:
+        return selected
 
     for candidate in candidates:
-        if len(selected) >= max_clips:
-            break
+        start, end = candidate["start"], candidate["end"]
 
-        # Check if this candidate overlaps with any already-selected clip
-        overlaps = False
-        for chosen in selected:
-            if candidate["start"] < chosen["end"] and candidate["end"] > chosen["start"]:
-                overlaps = True
-                break
+        # taken[:idx] are the selected clips that start before this one ends
+        idx = bisect_left(taken, (end,))
+        if idx and taken[idx - 1][1] > start:
+            continue
 
-        if not overlaps:
-            selected.append(candidate)
+        selected.append(candidate)
+        if len(selected) >= max_clips:
+            break
+        insort(taken, (start, end))
 
     return selected
-
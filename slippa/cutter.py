@@ -3,19 +3,39 @@ Cutter module — uses ffmpeg to cut clips from the source video.
 
 Supports two modes:
     1. Simple cut — one continuous ffmpeg cut (original behavior).
-    2. Smart cut — cuts multiple sub-segments and concatenates them
-       into one seamless clip (removes silence/dead air).
+    2. Smart cut — trims multiple sub-segments and concatenates them
+       into one seamless clip (removes silence/dead air) in a single pass.
 
 Also supports vertical (9:16) output for YouTube Shorts / TikTok / Reels.
+
+Each source video is probed once (stream codecs, audio present) and the
+result is reused by every cut. Keyframes are looked up only near the clip
+starts, and simple horizontal cuts of H.264/AAC sources that start on a
+keyframe are stream-copied instead of re-encoded.
 """
 
+import json
 import os
 import subprocess
-import tempfile
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
 
 
 OUTPUT_DIR = "clips"
 
+# A horizontal clip whose start lands within this many seconds of a
+# keyframe is stream-copied instead of re-encoded
+KEYFRAME_TOLERANCE = 0.05
+
+
+class VideoInfo(NamedTuple):
+    """Stream metadata for a source video, from one ffprobe run."""
+    has_audio: bool
+    video_codec: str | None
+    audio_codec: str | None
+
 
 def cut_clips(
     video_path: str,
@@ -23,22 +43,28 @@ def cut_clips(
     output_dir: str = OUTPUT_DIR,
     smart_edit: bool = False,
     output_format: str = "horizontal",
+    max_workers: int | None = None,
 ) -> list[str]:
     """
     Cut clips from a video file using ffmpeg.
 
+    Each clip is cut by one ffmpeg process — with output_format="both",
+    the horizontal and vertical versions come out of the same process
+    (one decode, two encodes). Clips are independent, so several run at
+    once on a thread pool (the work itself happens out-of-process).
+
     Args:
         video_path: Path to the source video.
         clips: List of clip dicts with "start", "end", and optionally "sub_segments".
         output_dir: Directory to save the cut clips.
         smart_edit: If True and clip has sub_segments, use concat mode.
         output_format: "horizontal" (original), "vertical" (9:16), or "both".
+        max_workers: Concurrent ffmpeg processes (default: half the CPU cores).
 
     Returns:
-        list[str]: Paths to the saved clip files.
+        list[str]: Paths to the saved clip files, in clip order.
     """
     os.makedirs(output_dir, exist_ok=True)
-    saved_paths = []
 
     base_name = os.path.splitext(os.path.basename(video_path))[0]
 
@@ -48,85 +74,266 @@ def cut_clips(
     else:
         formats_to_produce = [output_format]
 
+    tasks = []
     for i, clip in enumerate(clips):
+        outputs = []
         for fmt in formats_to_produce:
             suffix = "_vertical" if fmt == "vertical" else ""
             output_filename = f"{base_name}_clip_{i + 1}{suffix}.mp4"
-            output_path = os.path.join(output_dir, output_filename)
+            outputs.append((fmt, os.path.join(output_dir, output_filename)))
+        tasks.append((i, clip, outputs))
+
+    if not tasks:
+        return []
+
+    # Probe once up front; every cut below reuses the result
+    info = _probe(video_path)
+
+    # Keyframes only matter for simple horizontal cuts (stream copy)
+    keyframes = []
+    if "horizontal" in formats_to_produce and _can_stream_copy(info):
+        simple_starts = [
+            clip["start"] for clip in clips
+            if not (smart_edit and len(clip.get("sub_segments") or []) > 1)
+        ]
+        keyframes = _keyframes_near(video_path, simple_starts)
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_workers = min(max_workers, len(tasks))
 
-            sub_segments = clip.get("sub_segments") if smart_edit else None
+    def _cut(task):
+        i, clip, outputs = task
+        sub_segments = clip.get("sub_segments") if smart_edit else None
 
-            if sub_segments and len(sub_segments) > 1:
-                # Smart cut: cut each sub-segment → concat
-                _smart_cut(video_path, sub_segments, output_path, fmt, i, len(clips))
-            else:
-                # Simple cut
-                start = clip["start"]
-                duration = clip["end"] - start
-                _simple_cut(video_path, start, duration, output_path, fmt, i, len(clips))
+        if sub_segments and len(sub_segments) > 1:
+            # Smart cut: trim each sub-segment → concat
+            _smart_cut(video_path, sub_segments, outputs, i, len(clips), info=info)
+        else:
+            # Simple cut
+            start = clip["start"]
+            duration = clip["end"] - start
+            _simple_cut(
+                video_path, start, duration, outputs, i, len(clips),
+                info=info, keyframes=keyframes,
+            )
 
-            if os.path.exists(output_path):
-                saved_paths.append(output_path)
+        return [path for _, path in outputs]
 
-    return saved_paths
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        output_paths = [path for paths in pool.map(_cut, tasks) for path in paths]
+
+    return [path for path in output_paths if os.path.exists(path)]
+
+
+# Center-crop to 9:16 then scale to 1080x1920
+VERTICAL_FILTER = "crop=ih*9/16:ih,scale=1080:1920"
 
 
 def _build_video_filters(fmt: str) -> list[str]:
     """Build ffmpeg filter flags for the given output format."""
     if fmt == "vertical":
-        # Center-crop to 9:16 then scale to 1080x1920
-        return ["-vf", "crop=ih*9/16:ih,scale=1080:1920"]
+        return ["-vf", VERTICAL_FILTER]
     return []
 
 
+def _run_ffmpeg(cmd: list[str], error_message: str):
+    """
+    Run an ffmpeg command, printing its stderr if it fails.
+
+    ffmpeg writes output files directly, so stdout is discarded rather than
+    buffered, and stdin is closed so concurrent runs never wait on the
+    terminal. Only stderr is kept, for the error message.
+    """
+    try:
+        subprocess.run(
+            cmd,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"  ⚠️  {error_message}: {e.stderr}")
+    except FileNotFoundError:
+        print("  ❌ ffmpeg not found! Install it: brew install ffmpeg")
+
+
+def _probe(video_path: str) -> VideoInfo | None:
+    """
+    Return stream metadata for a video, cached per (path, mtime).
+
+    Only headers are read, so this is cheap even for long videos.
+    Returns None if ffprobe is unavailable or fails.
+    """
+    try:
+        mtime = os.path.getmtime(video_path)
+    except OSError:
+        return None
+    return _probe_cached(video_path, mtime)
+
+
+@lru_cache(maxsize=8)
+def _probe_cached(video_path: str, mtime: float) -> VideoInfo | None:
+    """Run ffprobe on a video (mtime is only part of the cache key)."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "stream=codec_type,codec_name",
+        "-of", "json",
+        video_path,
+    ]
+
+    data = _run_ffprobe(cmd)
+    if data is None:
+        return None
+
+    streams = data.get("streams") or []
+    video = next((s for s in streams if s.get("codec_type") == "video"), {})
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+    return VideoInfo(
+        has_audio=audio is not None,
+        video_codec=video.get("codec_name"),
+        audio_codec=audio.get("codec_name") if audio else None,
+    )
+
+
+def _keyframes_near(video_path: str, times: list[float]) -> list[float]:
+    """
+    Return the sorted video keyframe times within KEYFRAME_TOLERANCE of times.
+
+    Packet flags are read (no decoding) only inside a small -read_intervals
+    window around each time, so ffprobe seeks instead of walking the file.
+    Returns [] if there are no times or ffprobe fails.
+    """
+    if not times:
+        return []
+
+    intervals = ",".join(
+        f"{max(0.0, t - KEYFRAME_TOLERANCE):.3f}%+{2 * KEYFRAME_TOLERANCE:.3f}"
+        for t in sorted(set(times))
+    )
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-read_intervals", intervals,
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "json",
+        video_path,
+    ]
+
+    data = _run_ffprobe(cmd)
+    if data is None:
+        return []
+
+    keyframes = set()
+    for packet in data.get("packets", []):
+        if "K" in packet.get("flags", "") and "pts_time" in packet:
+            keyframes.add(float(packet["pts_time"]))
+    return sorted(keyframes)
+
+
+def _run_ffprobe(cmd: list[str]) -> dict | None:
+    """Run an ffprobe command and parse its JSON output, or None on failure."""
+    try:
+        result = subprocess.run(
+            cmd,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+        )
+        return json.loads(result.stdout)
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return None
+
+
+def _can_stream_copy(info: VideoInfo | None) -> bool:
+    """Whether the source's streams can be copied as-is into an H.264/AAC MP4 clip."""
+    return (
+        info is not None
+        and info.video_codec == "h264"
+        and info.audio_codec in ("aac", None)
+    )
+
+
+def _nearest_keyframe(keyframes: list[float], t: float) -> float | None:
+    """Return the keyframe within KEYFRAME_TOLERANCE of t, if any."""
+    idx = bisect_left(keyframes, t - KEYFRAME_TOLERANCE)
+    if idx < len(keyframes) and keyframes[idx] <= t + KEYFRAME_TOLERANCE:
+        return keyframes[idx]
+    return None
+
+
 def _simple_cut(
     video_path: str,
     start: float,
     duration: float,
-    output_path: str,
-    fmt: str,
+    outputs: list[tuple[str, str]],
     clip_idx: int,
     total_clips: int,
+    info: VideoInfo | None = None,
+    keyframes: list[float] | None = None,
 ):
-    """Cut a single continuous range from the video."""
+    """
+    Cut a single continuous range from the video.
+
+    Writes one file per (fmt, output_path) in outputs from a single ffmpeg
+    process. Horizontal outputs that start on a keyframe of an H.264/AAC
+    source are stream-copied, which runs at disk speed; everything else is
+    re-encoded, so every clip comes out H.264/AAC.
+    """
     print(f"  Cutting clip {clip_idx + 1}/{total_clips}: {start:.1f}s → {start + duration:.1f}s ({duration:.1f}s)")
 
+    keyframe = None
+    if keyframes and any(fmt == "horizontal" for fmt, _ in outputs):
+        keyframe = _nearest_keyframe(keyframes, start)
+
+    if keyframe is not None:
+        duration += start - keyframe
+        start = keyframe
+
+    output_args = []
+    for fmt, output_path in outputs:
+        if fmt == "horizontal" and keyframe is not None:
+            # Only the first video/audio stream, like the re-encoded clips
+            codec_flags = ["-map", "0:v:0", "-map", "0:a:0?", "-c", "copy"]
+        else:
+            codec_flags = [*_build_video_filters(fmt), "-c:v", "libx264", "-c:a", "aac"]
+        output_args += ["-t", str(duration), *codec_flags, output_path]
+
     cmd = [
         "ffmpeg",
         "-y",
         "-ss", str(start),
         "-i", video_path,
-        "-t", str(duration),
-        *_build_video_filters(fmt),
-        "-c:v", "libx264",
-        "-c:a", "aac",
         "-loglevel", "warning",
-        output_path,
+        *output_args,
     ]
 
-    try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
-    except subprocess.CalledProcessError as e:
-        print(f"  ⚠️  Error cutting clip {clip_idx + 1}: {e.stderr}")
-    except FileNotFoundError:
-        print("  ❌ ffmpeg not found! Install it: brew install ffmpeg")
+    _run_ffmpeg(cmd, f"Error cutting clip {clip_idx + 1}")
 
 
 def _smart_cut(
     video_path: str,
     sub_segments: list[dict],
-    output_path: str,
-    fmt: str,
+    outputs: list[tuple[str, str]],
     clip_idx: int,
     total_clips: int,
+    info: VideoInfo | None = None,
 ):
     """
     Cut multiple sub-segments and concatenate into one clip.
 
-    1. Cut each sub-segment to a temp file.
-    2. Write an ffmpeg concat list.
-    3. Concatenate all parts into the final output.
-    4. Clean up temp files.
+    Done in a single ffmpeg pass: the input is opened once (seeking to the
+    first sub-segment), each range is picked out with trim/atrim, and the
+    concat filter joins them before one final encode per (fmt, output_path)
+    in outputs. No intermediate files, no per-segment re-encodes.
+
+    Sources without an audio stream get a video-only graph.
     """
     total_duration = sum(s["end"] - s["start"] for s in sub_segments)
     print(
@@ -134,65 +341,65 @@ def _smart_cut(
         f"{len(sub_segments)} segments → {total_duration:.1f}s"
     )
 
-    temp_dir = tempfile.mkdtemp(prefix="slippa_")
-    temp_files = []
-
-    try:
-        # Step 1: Cut each sub-segment
-        for j, seg in enumerate(sub_segments):
-            seg_start = seg["start"]
-            seg_duration = seg["end"] - seg_start
-            temp_path = os.path.join(temp_dir, f"part_{j:03d}.mp4")
-
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-ss", str(seg_start),
-                "-i", video_path,
-                "-t", str(seg_duration),
-                *_build_video_filters(fmt),
-                "-c:v", "libx264",
-                "-c:a", "aac",
-                "-loglevel", "warning",
-                temp_path,
-            ]
-
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            temp_files.append(temp_path)
-
-        # Step 2: Write concat list
-        concat_list_path = os.path.join(temp_dir, "concat.txt")
-        with open(concat_list_path, "w") as f:
-            for temp_path in temp_files:
-                f.write(f"file '{temp_path}'\n")
-
-        # Step 3: Concatenate
-        concat_cmd = [
-            "ffmpeg",
-            "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", concat_list_path,
-            "-c", "copy",
-            "-loglevel", "warning",
-            output_path,
-        ]
+    # Timestamps restart at 0 after the input seek, so trim relative to it.
+    # Reading stops at the end of the last sub-segment.
+    seek = sub_segments[0]["start"]
+    span = sub_segments[-1]["end"] - seek
+    # Unprobed sources are assumed to have audio
+    has_audio = info.has_audio if info else True
+
+    filters = []
+    concat_inputs = ""
+    for j, seg in enumerate(sub_segments):
+        seg_start = seg["start"] - seek
+        seg_end = seg["end"] - seek
+        filters.append(
+            f"[0:v]trim=start={seg_start}:end={seg_end},setpts=PTS-STARTPTS[v{j}]"
+        )
+        concat_inputs += f"[v{j}]"
+        if has_audio:
+            filters.append(
+                f"[0:a]atrim=start={seg_start}:end={seg_end},asetpts=PTS-STARTPTS[a{j}]"
+            )
+            concat_inputs += f"[a{j}]"
+
+    if has_audio:
+        filters.append(f"{concat_inputs}concat=n={len(sub_segments)}:v=1:a=1[vcat][acat]")
+    else:
+        filters.append(f"{concat_inputs}concat=n={len(sub_segments)}:v=1:a=0[vcat]")
+
+    # Filter outputs can only be mapped once, so split per output file
+    n = len(outputs)
+    if n > 1:
+        video_labels = [f"vs{k}" for k in range(n)]
+        audio_labels = [f"as{k}" for k in range(n)]
+        filters.append(f"[vcat]split={n}" + "".join(f"[{v}]" for v in video_labels))
+        if has_audio:
+            filters.append(f"[acat]asplit={n}" + "".join(f"[{a}]" for a in audio_labels))
+    else:
+        video_labels = ["vcat"]
+        audio_labels = ["acat"]
+
+    output_args = []
+    for k, (fmt, output_path) in enumerate(outputs):
+        video = video_labels[k]
+        if fmt == "vertical":
+            filters.append(f"[{video}]{VERTICAL_FILTER}[vout{k}]")
+            video = f"vout{k}"
+        output_args += ["-map", f"[{video}]", "-c:v", "libx264"]
+        if has_audio:
+            output_args += ["-map", f"[{audio_labels[k]}]", "-c:a", "aac"]
+        output_args.append(output_path)
 
-        subprocess.run(concat_cmd, check=True, capture_output=True, text=True)
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss", str(seek),
+        "-t", str(span),
+        "-i", video_path,
+        "-filter_complex", ";".join(filters),
+        "-loglevel", "warning",
+        *output_args,
+    ]
 
-    except subprocess.CalledProcessError as e:
-        print(f"  ⚠️  Error smart-cutting clip {clip_idx + 1}: {e.stderr}")
-    except FileNotFoundError:
-        print("  ❌ ffmpeg not found! Install it: brew install ffmpeg")
-    finally:
-        # Step 4: Clean up temp files
-        for temp_path in temp_files:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
-        try:
-            os.remove(os.path.join(temp_dir, "concat.txt"))
-            os.rmdir(temp_dir)
-        except OSError:
-            pass
+    _run_ffmpeg(cmd, f"Error smart-cutting clip {clip_idx + 1}")
@@ -1,69 +1,251 @@
 """
 SQLite database layer for Slippa job persistence.
 
-Stores jobs so they survive server restarts. Uses a single
-'jobs' table with JSON-serialized clips data.
+Stores jobs so they survive server restarts. Uses a 'jobs' table, plus
+a 'clips' table holding each job's clips as one JSON row per clip.
+
+update_job() doesn't write straight away: updates are merged per job and
+written by a background thread every FLUSH_INTERVAL seconds, so rapid
+progress ticks cost one UPDATE. Reads flush pending writes first, and
+final statuses ("done", "error") are written immediately.
 """
 
+import atexit
+import dataclasses
 import json
 import os
+import queue
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json works fine
+    orjson = None
+
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "slippa.db")
 
 
+def _dumps(value) -> str:
+    """Serialize a value for a TEXT column, using orjson when available.
+
+    Dataclass instances (e.g. slippa.web.ClipInfo) are stored as objects.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, default=_json_default)
+
+
+def _json_default(value):
+    """json.dumps fallback for types orjson handles natively."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _loads(text: str):
+    """Parse a JSON TEXT column, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Idle connections, reused most-recently-returned first. Jobs run in
+# background threads, so connections are opened with check_same_thread=False
+# and only ever used by one thread at a time.
+POOL_SIZE = 8
+_POOL: queue.LifoQueue = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+# Per-connection settings, applied once when a pooled connection is opened.
+# (journal_mode=WAL is persistent in the database file, so init_db sets it.)
+# synchronous=NORMAL is safe under WAL and skips the fsync on every commit.
+# The sqlite3 timeout below already acts as the busy timeout.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",       # 64 MB page cache
+    "PRAGMA mmap_size=67108864",      # 64 MB memory-mapped reads
+    "PRAGMA journal_size_limit=6144000",
+)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a new connection with the per-connection pragmas applied."""
+    conn = sqlite3.connect(DB_PATH, timeout=10, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
 @contextmanager
 def _conn():
-    """Yield a connection with WAL mode and auto-commit."""
-    conn = sqlite3.connect(DB_PATH, timeout=10)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    """Yield a pooled connection, committing on success."""
+    try:
+        conn = _POOL.get_nowait()
+    except queue.Empty:
+        conn = _connect()
     try:
         yield conn
         conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        try:
+            _POOL.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+# created_at is milliseconds since the epoch: a compact integer key that
+# sorts numerically. _row_to_dict turns it back into an ISO string.
+# rev counts writes to the job (and its clips); it serves as an ETag.
+_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id          TEXT PRIMARY KEY,
+        status      TEXT NOT NULL DEFAULT 'starting',
+        progress    TEXT NOT NULL DEFAULT 'Starting...',
+        percent     INTEGER NOT NULL DEFAULT 0,
+        video_title TEXT DEFAULT '',
+        source      TEXT DEFAULT '',
+        error       TEXT,
+        clips       TEXT DEFAULT '[]',
+        batch       INTEGER DEFAULT 0,
+        created_at  INTEGER NOT NULL,
+        rev         INTEGER NOT NULL DEFAULT 0
+    )
+"""
 
 
 def init_db():
-    """Create the jobs table if it doesn't exist."""
+    """Create the jobs and clips tables if they don't exist."""
     with _conn() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id          TEXT PRIMARY KEY,
-                status      TEXT NOT NULL DEFAULT 'starting',
-                progress    TEXT NOT NULL DEFAULT 'Starting...',
-                percent     INTEGER NOT NULL DEFAULT 0,
-                video_title TEXT DEFAULT '',
-                source      TEXT DEFAULT '',
-                error       TEXT,
-                clips       TEXT DEFAULT '[]',
-                batch       INTEGER DEFAULT 0,
-                created_at  TEXT NOT NULL
-            )
-        """)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_JOBS_TABLE.format(name="jobs"))
         # Migration: add percent column to existing databases
         try:
             conn.execute("ALTER TABLE jobs ADD COLUMN percent INTEGER NOT NULL DEFAULT 0")
         except Exception:
             pass  # column already exists
+        _migrate_created_at(conn)
+        # Migration: add rev column to existing databases
+        try:
+            conn.execute("ALTER TABLE jobs ADD COLUMN rev INTEGER NOT NULL DEFAULT 0")
+        except Exception:
+            pass  # column already exists
+        # list_jobs() sorts on created_at — index it so that's not a full scan
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC)"
+        )
+        # One row per clip, so job listings can count clips in SQL
+        # without fetching or decoding any clip JSON
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS clips (
+                job_id  TEXT NOT NULL,
+                idx     INTEGER NOT NULL,
+                data    TEXT NOT NULL,
+                PRIMARY KEY (job_id, idx)
+            ) WITHOUT ROWID
+        """)
+        # Migration: move clips stored inline in jobs.clips (older databases)
+        # into the clips table. The jobs.clips column is no longer used.
+        conn.execute("""
+            INSERT OR IGNORE INTO clips (job_id, idx, data)
+            SELECT jobs.id, each.key, each.value
+            FROM jobs, json_each(jobs.clips) AS each
+            WHERE jobs.clips NOT IN ('', '[]')
+        """)
+        conn.execute("UPDATE jobs SET clips = '[]' WHERE clips NOT IN ('', '[]')")
 
 
-def _row_to_dict(row) -> dict:
-    """Convert a sqlite3.Row to the same dict format web.py expects."""
+def _migrate_created_at(conn):
+    """
+    Rebuild a jobs table whose created_at is an ISO TEXT column (older
+    databases) with epoch-ms INTEGER timestamps. The stored strings are
+    local time, hence the 'utc' modifier.
+    """
+    column_types = {
+        row["name"]: row["type"].upper()
+        for row in conn.execute("PRAGMA table_info(jobs)")
+    }
+    if column_types.get("created_at") != "TEXT":
+        return
+
+    columns = "id, status, progress, percent, video_title, source, error, clips, batch"
+    conn.execute("DROP TABLE IF EXISTS jobs_new")
+    conn.execute(_JOBS_TABLE.format(name="jobs_new"))
+    conn.execute(f"""
+        INSERT INTO jobs_new ({columns}, created_at)
+        SELECT {columns},
+               CAST(ROUND((julianday(created_at, 'utc') - 2440587.5) * 86400000) AS INTEGER)
+        FROM jobs
+    """)
+    conn.execute("DROP TABLE jobs")
+    conn.execute("ALTER TABLE jobs_new RENAME TO jobs")
+
+
+def _now_ms() -> int:
+    """Current time in milliseconds since the epoch."""
+    return int(time.time() * 1000)
+
+
+def _iso(ms: int) -> str:
+    """Epoch milliseconds → local-time ISO string (the format web.py shows)."""
+    return datetime.fromtimestamp(ms / 1000).isoformat()
+
+
+_JOB_COLUMNS = "id, status, progress, percent, video_title, source, error, batch, created_at, rev"
+
+# Job columns plus the number of clips, without fetching the clips
+_SUMMARY_COLUMNS = (
+    f"{_JOB_COLUMNS}, "
+    "(SELECT COUNT(*) FROM clips WHERE clips.job_id = jobs.id) AS clip_count"
+)
+
+
+def _row_to_dict(row, clips: list[dict] | None = None) -> dict:
+    """Convert a sqlite3.Row to the same dict format web.py expects.
+
+    Summary rows (see list_jobs) are passed without clips; they get an
+    empty clips list and keep the clip_count computed by SQLite.
+    """
     d = dict(row)
-    d["clips"] = json.loads(d["clips"]) if d["clips"] else []
+    d["clips"] = clips if clips is not None else []
+    d.setdefault("clip_count", len(d["clips"]))
     d["batch"] = bool(d["batch"])
+    d["created_at"] = _iso(d["created_at"])
     return d
 
 
+# ---- Write coalescing ----
+
+FLUSH_INTERVAL = 0.2  # seconds between background flushes
+FINAL_STATUSES = {"done", "error"}  # written immediately, never delayed
+
+_PENDING: dict[str, dict] = {}  # job_id → merged fields not yet written
+# job_id → last known value of each scalar field (as read, or as last
+# queued), so update_job can drop fields that wouldn't change anything.
+# Clips are always written — they're mutable and set about once per job.
+# Finished jobs are dropped, and at most LAST_STATE_SIZE jobs are kept
+# (least recently used evicted), so polling old jobs can't grow it.
+LAST_STATE_SIZE = 1024
+_LAST_STATE: OrderedDict[str, dict] = OrderedDict()
+_PENDING_LOCK = threading.Lock()
+_FLUSH_LOCK = threading.Lock()
+_writer = None
+
+
 # ---- CRUD ----
 
 def create_job(job_id: str, source: str, batch: bool = False) -> dict:
     """Insert a new job and return its dict."""
-    now = datetime.now().isoformat()
+    now = _now_ms()
     status = "queued" if batch else "starting"
     progress = "Queued..." if batch else "Starting..."
 
@@ -74,7 +256,7 @@ def create_job(job_id: str, source: str, batch: bool = False) -> dict:
             (job_id, status, progress, source, int(batch), now),
         )
 
-    return {
+    job = {
         "id": job_id,
         "status": status,
         "progress": progress,
@@ -83,20 +265,64 @@ def create_job(job_id: str, source: str, batch: bool = False) -> dict:
         "error": None,
         "clips": [],
         "batch": batch,
-        "created_at": now,
+        "created_at": _iso(now),
     }
+    _remember(job_id, job)
+    return job
+
+
+def _remember(job_id: str, job: dict):
+    """Record a job's current field values for update_job's no-op check."""
+    with _PENDING_LOCK:
+        if job.get("status") in FINAL_STATUSES:
+            _LAST_STATE.pop(job_id, None)  # no further updates expected
+            return
+        _set_last_state(job_id, {k: v for k, v in job.items() if k != "clips"})
+
+
+def _set_last_state(job_id: str, state: dict):
+    """Store a job's last known state, evicting the least recently used."""
+    # Caller holds _PENDING_LOCK
+    _LAST_STATE[job_id] = state
+    _LAST_STATE.move_to_end(job_id)
+    if len(_LAST_STATE) > LAST_STATE_SIZE:
+        _LAST_STATE.popitem(last=False)
 
 
 def get_job(job_id: str) -> dict | None:
     """Fetch one job by ID. Returns None if not found."""
+    flush(job_id)
     with _conn() as conn:
-        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-    return _row_to_dict(row) if row else None
+        row = conn.execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        clips = [
+            _loads(data) for (data,) in conn.execute(
+                "SELECT data FROM clips WHERE job_id = ? ORDER BY idx", (job_id,)
+            )
+        ]
+    job = _row_to_dict(row, clips)
+    _remember(job_id, job)
+    return job
+
+
+def get_job_rev(job_id: str) -> int | None:
+    """Return a job's revision (bumped on every write), or None if not found."""
+    flush(job_id)
+    with _conn() as conn:
+        row = conn.execute("SELECT rev FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return row["rev"] if row else None
 
 
 def update_job(job_id: str, **fields):
     """Update specific fields on a job.
 
+    The write is queued and coalesced with other pending updates to the
+    same job (later values win); see flush(). Fields that already hold
+    the given value are skipped, and nothing is queued if none changed.
+
     Usage:
         update_job("abc123", status="done", progress="All done!")
     """
@@ -105,26 +331,102 @@ def update_job(job_id: str, **fields):
     for k, v in fields.items():
         if k not in allowed:
             continue
-        if k == "clips":
-            v = json.dumps(v)
         if k == "batch":
             v = int(v)
         updates[k] = v
 
-    if not updates:
+    with _PENDING_LOCK:
+        last = _LAST_STATE.get(job_id, {})
+        updates = {
+            k: v for k, v in updates.items()
+            if k == "clips" or k not in last or last[k] != v
+        }
+        if not updates:
+            return
+        if updates.get("status") in FINAL_STATUSES:
+            _LAST_STATE.pop(job_id, None)
+        else:
+            last.update((k, v) for k, v in updates.items() if k != "clips")
+            _set_last_state(job_id, last)
+        _PENDING.setdefault(job_id, {}).update(updates)
+
+    if updates.get("status") in FINAL_STATUSES:
+        flush(job_id)
+    else:
+        _start_writer()
+
+
+def flush(job_id: str | None = None):
+    """Write pending updates now — for one job, or all jobs if job_id is None."""
+    # Held from taking the updates until they're committed, so two flushes
+    # can't commit one job's updates out of order
+    with _FLUSH_LOCK:
+        with _PENDING_LOCK:
+            if job_id is None:
+                pending = dict(_PENDING)
+                _PENDING.clear()
+            elif job_id in _PENDING:
+                pending = {job_id: _PENDING.pop(job_id)}
+            else:
+                return
+        if not pending:
+            return
+
+        with _conn() as conn:
+            for jid, updates in pending.items():
+                _write_updates(conn, jid, updates)
+
+
+# Don't lose the last ticks on a clean shutdown
+atexit.register(flush)
+
+
+def _write_updates(conn, job_id: str, updates: dict):
+    """Apply one job's merged update_job() fields."""
+    columns = {k: v for k, v in updates.items() if k != "clips"}
+    set_clause = "".join(f"{k} = ?, " for k in columns)
+    values = list(columns.values()) + [job_id]
+    conn.execute(f"UPDATE jobs SET {set_clause}rev = rev + 1 WHERE id = ?", values)
+    if "clips" in updates:
+        # Replace the job's whole clip list
+        conn.execute("DELETE FROM clips WHERE job_id = ?", (job_id,))
+        conn.executemany(
+            "INSERT INTO clips (job_id, idx, data) VALUES (?, ?, ?)",
+            [(job_id, idx, _dumps(clip)) for idx, clip in enumerate(updates["clips"])],
+        )
+
+
+def _start_writer():
+    """Start the background flush thread if it isn't running yet."""
+    global _writer
+    if _writer is not None:
         return
+    with _PENDING_LOCK:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="db-writer", daemon=True)
+            _writer.start()
 
-    set_clause = ", ".join(f"{k} = ?" for k in updates)
-    values = list(updates.values()) + [job_id]
 
-    with _conn() as conn:
-        conn.execute(f"UPDATE jobs SET {set_clause} WHERE id = ?", values)
+def _writer_loop():
+    """Flush pending updates every FLUSH_INTERVAL seconds, forever."""
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            flush()
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Failed to write job updates: {e}")
 
 
 def list_jobs(limit: int = 100) -> list[tuple[str, dict]]:
-    """Return all jobs as (id, dict) tuples, newest first."""
+    """Return all jobs as (id, dict) tuples, newest first.
+
+    Clips aren't fetched or decoded — each dict has an empty "clips" list
+    and a "clip_count". Use get_job() for a job's full clip data.
+    """
+    flush()
     with _conn() as conn:
         rows = conn.execute(
-            "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            f"SELECT {_SUMMARY_COLUMNS} FROM jobs ORDER BY created_at DESC LIMIT ?",
+            (limit,),
         ).fetchall()
     return [(row["id"], _row_to_dict(row)) for row in rows]
@@ -8,6 +8,8 @@ Why yt-dlp?
 """
 
 import os
+from typing import NamedTuple
+
 import yt_dlp
 
 
@@ -15,7 +17,13 @@ import yt_dlp
 DOWNLOAD_DIR = "downloads"
 
 
-def download_video(url: str, output_dir: str = DOWNLOAD_DIR) -> str:
+class DownloadResult(NamedTuple):
+    """A downloaded video: where it was saved and its original title."""
+    path: str
+    title: str
+
+
+def download_video(url: str, output_dir: str = DOWNLOAD_DIR) -> DownloadResult:
     """
     Download a video from a YouTube URL.
 
@@ -24,7 +32,8 @@ def download_video(url: str, output_dir: str = DOWNLOAD_DIR) -> str:
         output_dir: Directory to save the downloaded video.
 
     Returns:
-        str: Path to the downloaded video file.
+        DownloadResult: Path to the downloaded video file, and the video's
+        title as reported by yt-dlp (unlike the filename, not sanitized).
 
     How it works:
         1. We configure yt-dlp with options:
@@ -33,9 +42,11 @@ def download_video(url: str, output_dir: str = DOWNLOAD_DIR) -> str:
               → Falls back to best single MP4 if separate streams aren't available.
            - 'outtmpl': sets the output filename template.
            - 'merge_output_format': ensures final output is mp4.
+           - Fragmented (DASH/HLS) formats are fetched 8 fragments at a
+             time, and plain HTTP downloads in 10 MB ranged chunks.
         2. yt-dlp handles all the complexity of YouTube's streaming formats,
            downloading, and merging audio+video.
-        3. We return the path to the final merged file.
+        3. We return the path to the final merged file, with its title.
     """
     os.makedirs(output_dir, exist_ok=True)
 
@@ -46,6 +57,9 @@ def download_video(url: str, output_dir: str = DOWNLOAD_DIR) -> str:
         "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best",
         "outtmpl": output_template,
         "merge_output_format": "mp4",
+        "concurrent_fragment_downloads": 8,
+        "http_chunk_size": 10 * 1024 * 1024,
+        "fragment_retries": 5,
         "quiet": False,
         "no_warnings": False,
     }
@@ -53,12 +67,18 @@ def download_video(url: str, output_dir: str = DOWNLOAD_DIR) -> str:
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         # extract_info downloads the video and returns metadata
         info = ydl.extract_info(url, download=True)
+        title = info.get("title") or "video"
+
+        # yt-dlp reports the final (post-merge) path of what it wrote
+        downloads = info.get("requested_downloads") or []
+        if downloads and downloads[0].get("filepath"):
+            return DownloadResult(downloads[0]["filepath"], title)
 
-        # Build the actual output path from the metadata
+        # Older yt-dlp: build the path from the metadata
         filename = ydl.prepare_filename(info)
 
         # Ensure it ends with .mp4 (yt-dlp might have merged formats)
         if not filename.endswith(".mp4"):
             filename = os.path.splitext(filename)[0] + ".mp4"
 
-    return filename
+    return DownloadResult(filename, title)
@@ -2,8 +2,10 @@
 Scorer module — NLP-powered engagement scoring for clip selection.
 
 Analyzes transcript text to predict how engaging / viral a clip would be.
-Uses lightweight libraries (TextBlob + regex) so everything runs locally
-with no API keys and no large model downloads.
+Uses lightweight libraries (TextBlob's sentiment lexicon + regex) so
+everything runs locally with no API keys and no large model downloads.
+Sentences and words are split with plain regexes rather than NLTK
+tokenizers, which keeps scoring fast and corpus-free.
 
 Scoring dimensions:
     1. Engagement  — questions, calls-to-action, exclamations, hooks
@@ -16,56 +18,85 @@ Each dimension scores 0-10, and the final score is a weighted average.
 
 import re
 import math
-from textblob import TextBlob
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from textblob.en import sentiment as _pattern_sentiment
 
 
 # ── Keyword / pattern banks ────────────────────────────────────────────
+# Each bank is fused into one alternation at import time, so counting its
+# hits is a single findall pass over the text.
+
+def _compile(patterns: list[str]) -> re.Pattern:
+    """Fuse a pattern bank into one case-insensitive alternation regex."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
 
 # Engagement hooks — phrases that grab attention
-HOOK_PATTERNS = [
-    r"\b(here'?s the thing|the truth is|let me tell you|listen)\b",
-    r"\b(you need to|you have to|you should|you must)\b",
-    r"\b(number one|first of all|most important)\b",
-    r"\b(secret|hack|trick|tip|mistake|problem)\b",
-    r"\b(never|always|every single|literally)\b",
-    r"\b(crazy|insane|unbelievable|incredible|amazing|mind.?blowing)\b",
-    r"\b(broke|blew my mind|changed my life|game.?changer)\b",
-    r"\b(don'?t make this mistake|stop doing|warning)\b",
-]
+HOOK_PATTERNS = _compile([
+    r"\b(?:here'?s the thing|the truth is|let me tell you|listen)\b",
+    r"\b(?:you need to|you have to|you should|you must)\b",
+    r"\b(?:number one|first of all|most important)\b",
+    r"\b(?:secret|hack|trick|tip|mistake|problem)\b",
+    r"\b(?:never|always|every single|literally)\b",
+    r"\b(?:crazy|insane|unbelievable|incredible|amazing|mind.?blowing)\b",
+    r"\b(?:broke|blew my mind|changed my life|game.?changer)\b",
+    r"\b(?:don'?t make this mistake|stop doing|warning)\b",
+])
 
 # Virality triggers — controversial / emotional / surprising content
-VIRAL_PATTERNS = [
-    r"\b(controversial|unpopular opinion|hot take|hear me out)\b",
-    r"\b(no one talks about|they don'?t want you to know)\b",
-    r"\b(plot twist|wait for it|you won'?t believe)\b",
-    r"\b(worst|best|biggest|most underrated|overrated)\b",
-    r"\b(debate|fight me|disagree|wrong|right)\b",
-    r"\b(money|income|salary|million|billion|expensive|free)\b",
-    r"\b(fail|success|win|lose|destroy|dominate)\b",
-    r"\b(story ?time|so basically|okay so)\b",
-]
+VIRAL_PATTERNS = _compile([
+    r"\b(?:controversial|unpopular opinion|hot take|hear me out)\b",
+    r"\b(?:no one talks about|they don'?t want you to know)\b",
+    r"\b(?:plot twist|wait for it|you won'?t believe)\b",
+    r"\b(?:worst|best|biggest|most underrated|overrated)\b",
+    r"\b(?:debate|fight me|disagree|wrong|right)\b",
+    r"\b(?:money|income|salary|million|billion|expensive|free)\b",
+    r"\b(?:fail|success|win|lose|destroy|dominate)\b",
+    r"\b(?:story ?time|so basically|okay so)\b",
+])
 
 # Storytelling indicators — narrative structure = more watchable
-STORY_PATTERNS = [
-    r"\b(so what happened was|long story short|basically)\b",
-    r"\b(and then|but then|suddenly|out of nowhere)\b",
-    r"\b(turned out|ended up|realized|found out)\b",
-    r"\b(i remember|i was|we were|this one time)\b",
-    r"\b(beginning|middle|end|finally|eventually)\b",
-]
+STORY_PATTERNS = _compile([
+    r"\b(?:so what happened was|long story short|basically)\b",
+    r"\b(?:and then|but then|suddenly|out of nowhere)\b",
+    r"\b(?:turned out|ended up|realized|found out)\b",
+    r"\b(?:i remember|i was|we were|this one time)\b",
+    r"\b(?:beginning|middle|end|finally|eventually)\b",
+])
 
 # Call-to-action patterns
-CTA_PATTERNS = [
-    r"\b(subscribe|like|comment|share|follow|click|check out|link)\b",
-    r"\b(let me know|tell me|what do you think|drop a comment)\b",
-    r"\b(smash that|hit the|leave a)\b",
-]
+CTA_PATTERNS = _compile([
+    r"\b(?:subscribe|like|comment|share|follow|click|check out|link)\b",
+    r"\b(?:let me know|tell me|what do you think|drop a comment)\b",
+    r"\b(?:smash that|hit the|leave a)\b",
+])
+
+# Superlatives / absolutes and standalone numbers (used by virality)
+_SUPERLATIVE_RE = re.compile(r"\b(?:best|worst|most|least|always|never|every|none)\b")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+
+# Tokenizers: sentence breaks after terminal punctuation, lowercase words,
+# and runs of capitalized words (a cheap stand-in for noun phrases)
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_CAPS_RUN_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*")
+
+# Recent results keyed on (text, duration, segment_count) — scoring is pure,
+# and re-runs of the same video (retries, re-clipping with new settings)
+# score the same windows again. Least recently used entries are evicted.
+RESULT_CACHE_SIZE = 4096
+_RESULT_CACHE: OrderedDict = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
 
 
 def score_engagement(
     text: str,
     duration: float,
     segment_count: int,
+    word_count: int | None = None,
+    sentence_cache: dict | None = None,
 ) -> dict:
     """
     Score a clip's engagement potential using NLP analysis.
@@ -74,6 +105,10 @@ def score_engagement(
         text: The transcript text of the clip.
         duration: Clip duration in seconds.
         segment_count: Number of transcript segments in the clip.
+        word_count: Whitespace-separated word count of text, if the caller
+                    already knows it (saves re-splitting the text).
+        sentence_cache: Optional dict shared between calls to reuse
+                        per-sentence sentiment (see score_engagement_batch).
 
     Returns:
         dict with keys:
@@ -85,26 +120,59 @@ def score_engagement(
             - label: str — human-readable quality label
             - breakdown: dict — detailed sub-scores for debugging
     """
-    if not text or duration <= 0:
+    # Nothing to analyze: skip all NLP work (and the cache)
+    if not text or text.isspace() or duration <= 0:
         return _empty_score()
 
+    key = (text, duration, segment_count)
+    with _RESULT_CACHE_LOCK:
+        result = _RESULT_CACHE.get(key)
+        if result is not None:
+            _RESULT_CACHE.move_to_end(key)
+
+    if result is None:
+        if sentence_cache is None:
+            sentence_cache = {}
+        result = _score_uncached(text, duration, segment_count, word_count, sentence_cache)
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[key] = result
+            if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+
+    return _copy_score(result)
+
+
+def _score_uncached(
+    text: str,
+    duration: float,
+    segment_count: int,
+    word_count: int | None,
+    sentence_cache: dict,
+) -> dict:
+    """Compute score_engagement's result (no result caching)."""
     text_lower = text.lower()
-    blob = TextBlob(text)
-    sentences = blob.sentences or [blob]
+    sentences = _split_sentences(text)
+    # Word count per sentence, shared by coherence and virality
+    sent_lengths = [len(s.split()) for s in sentences]
 
     # ── Dimension 1: Engagement ────────────────────────────────────
+    if word_count is None:
+        word_count = len(text.split())
+
     engagement, eng_details = _score_engagement_signals(
-        text, text_lower, sentences, duration
+        text, text_lower, sentences, duration, word_count
     )
 
     # ── Dimension 2: Emotion ───────────────────────────────────────
-    emotion, emo_details = _score_emotion(blob, sentences)
+    emotion, emo_details = _score_emotion(text, sentences, sentence_cache)
 
     # ── Dimension 3: Coherence ─────────────────────────────────────
-    coherence, coh_details = _score_coherence(blob, sentences, duration)
+    coherence, coh_details = _score_coherence(
+        text_lower, sentences, sent_lengths, duration
+    )
 
     # ── Dimension 4: Virality ──────────────────────────────────────
-    virality, vir_details = _score_virality(text_lower, sentences)
+    virality, vir_details = _score_virality(text_lower, sent_lengths)
 
     # ── Duration bonus (same idea as before, but gentler) ──────────
     duration_bonus = _duration_bonus(duration)
@@ -138,6 +206,41 @@ def score_engagement(
     }
 
 
+def score_engagement_batch(
+    texts: list[str],
+    durations: list[float],
+    segment_counts: list[int],
+    word_counts: list[int] | None = None,
+) -> list[dict]:
+    """
+    Score many clips at once. Same results as calling score_engagement
+    on each, but per-sentence sentiment is computed once for the whole
+    batch — overlapping candidate windows share most of their sentences.
+
+    Returns:
+        list[dict]: One score_engagement result per input, in order.
+    """
+    if word_counts is None:
+        word_counts = [None] * len(texts)
+
+    sentence_cache = {}
+    return [
+        score_engagement(text, duration, seg_count, word_count, sentence_cache)
+        for text, duration, seg_count, word_count
+        in zip(texts, durations, segment_counts, word_counts)
+    ]
+
+
+def _copy_score(result: dict) -> dict:
+    """Copy a cached result so callers can't mutate the cache's copy."""
+    copy = dict(result)
+    copy["breakdown"] = {
+        k: dict(v) if isinstance(v, dict) else v
+        for k, v in result["breakdown"].items()
+    }
+    return copy
+
+
 def _empty_score() -> dict:
     """Return a zeroed-out score dict."""
     return {
@@ -156,8 +259,9 @@ def _empty_score() -> dict:
 def _score_engagement_signals(
     text: str,
     text_lower: str,
-    sentences,
+    sentences: list[str],
     duration: float,
+    word_count: int,
 ) -> tuple[float, dict]:
     """
     Score based on hooks, questions, exclamations, CTAs, and word density.
@@ -173,7 +277,6 @@ def _score_engagement_signals(
     exclamation_count = text.count("!")
 
     # Word density (speech rate) — ~2.5 wps is normal, higher = energetic
-    word_count = len(text.split())
     wps = word_count / duration if duration > 0 else 0
 
     # Scoring
@@ -209,7 +312,11 @@ def _score_engagement_signals(
 
 # ── Emotion scoring ────────────────────────────────────────────────────
 
-def _score_emotion(blob: TextBlob, sentences) -> tuple[float, dict]:
+def _score_emotion(
+    text: str,
+    sentences: list[str],
+    sentence_cache: dict,
+) -> tuple[float, dict]:
     """
     Score based on sentiment intensity. Strong feelings = engaging.
     Neutral/bland = boring.
@@ -217,16 +324,15 @@ def _score_emotion(blob: TextBlob, sentences) -> tuple[float, dict]:
     if not sentences:
         return 0.0, {}
 
-    # Get polarity and subjectivity
-    polarity = blob.sentiment.polarity       # -1 to 1
-    subjectivity = blob.sentiment.subjectivity  # 0 to 1
+    # Get polarity (-1 to 1) and subjectivity (0 to 1)
+    polarity, subjectivity = _pattern_sentiment(text)
 
     # We care about INTENSITY, not direction
     # Very positive or very negative = engaging
     intensity = abs(polarity)
 
     # Per-sentence variance — emotional rollercoasters are engaging
-    sentence_polarities = [s.sentiment.polarity for s in sentences]
+    sentence_polarities = _sentence_polarities(sentences, sentence_cache)
     if len(sentence_polarities) > 1:
         variance = _variance(sentence_polarities)
         swing_bonus = min(3.0, variance * 10.0)
@@ -256,31 +362,35 @@ def _score_emotion(blob: TextBlob, sentences) -> tuple[float, dict]:
 # ── Coherence scoring ──────────────────────────────────────────────────
 
 def _score_coherence(
-    blob: TextBlob,
-    sentences,
+    text_lower: str,
+    sentences: list[str],
+    sent_lengths: list[int],
     duration: float,
 ) -> tuple[float, dict]:
     """
     Score topic focus. A clip that stays on one subject feels complete.
     Rambling text with many unrelated topics scores lower.
     """
-    words = [w.lower() for w in blob.words if len(w) > 3]
-
-    if len(words) < 5:
+    # One pass over the text: content-word total and distinct count
+    unique_words = set()
+    total_words = 0
+    for w in _WORD_RE.findall(text_lower):
+        if len(w) > 3:
+            unique_words.add(w)
+            total_words += 1
+
+    if total_words < 5:
         return 5.0, {"reason": "too_few_words"}
 
     # Simple approach: measure word repetition as a proxy for topic focus
     # More repeated content words = more focused on one topic
-    unique_words = set(words)
-    repetition_ratio = 1.0 - (len(unique_words) / len(words))
+    repetition_ratio = 1.0 - (len(unique_words) / total_words)
 
     # Noun phrase density — more noun phrases = more concrete/focused
-    noun_phrases = blob.noun_phrases
-    np_density = len(noun_phrases) / max(1, len(sentences))
+    np_density = _count_noun_phrases(sentences) / max(1, len(sentences))
 
     # Sentence length consistency — similar sentence lengths = better structure
-    if len(sentences) > 1:
-        sent_lengths = [len(str(s).split()) for s in sentences]
+    if len(sent_lengths) > 1:
         avg_len = sum(sent_lengths) / len(sent_lengths)
         length_variance = _variance(sent_lengths)
         consistency = max(0, 1.0 - (length_variance / max(1, avg_len ** 2)))
@@ -304,7 +414,7 @@ def _score_coherence(
 
 # ── Virality scoring ───────────────────────────────────────────────────
 
-def _score_virality(text_lower: str, sentences) -> tuple[float, dict]:
+def _score_virality(text_lower: str, sent_lengths: list[int]) -> tuple[float, dict]:
     """
     Score potential virality based on controversial, surprising,
     or emotionally provocative language.
@@ -313,19 +423,14 @@ def _score_virality(text_lower: str, sentences) -> tuple[float, dict]:
     story_hits = _count_pattern_hits(text_lower, STORY_PATTERNS)
 
     # Superlatives and absolutes are viral ("the BEST", "NEVER do this")
-    superlative_count = len(re.findall(
-        r"\b(best|worst|most|least|always|never|every|none)\b",
-        text_lower,
-    ))
+    superlative_count = len(_SUPERLATIVE_RE.findall(text_lower))
 
     # Short punchy sentences are more shareable
-    punchy_sentences = sum(
-        1 for s in sentences if len(str(s).split()) <= 8
-    )
-    punch_ratio = punchy_sentences / max(1, len(sentences))
+    punchy_sentences = sum(1 for n in sent_lengths if n <= 8)
+    punch_ratio = punchy_sentences / max(1, len(sent_lengths))
 
     # Numbers / stats make content feel authoritative
-    number_count = len(re.findall(r"\b\d+\b", text_lower))
+    number_count = len(_NUMBER_RE.findall(text_lower))
 
     viral_score = min(10.0, viral_hits * 1.8)
     story_score = min(10.0, story_hits * 2.5)
@@ -354,20 +459,48 @@ def _score_virality(text_lower: str, sentences) -> tuple[float, dict]:
 
 # ── Helpers ────────────────────────────────────────────────────────────
 
-def _count_pattern_hits(text: str, patterns: list[str]) -> int:
-    """Count total regex matches across all patterns."""
-    total = 0
-    for pattern in patterns:
-        total += len(re.findall(pattern, text, re.IGNORECASE))
-    return total
+def _count_pattern_hits(text: str, pattern: re.Pattern) -> int:
+    """Count non-overlapping matches of a fused pattern bank."""
+    return len(pattern.findall(text))
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences at terminal punctuation."""
+    return [s for s in _SENT_RE.split(text.strip()) if s] or [text]
+
+
+def _count_noun_phrases(sentences: list[str]) -> int:
+    """
+    Approximate noun-phrase count: runs of capitalized words, ignoring
+    each sentence's first word (capitalized anyway).
+    """
+    count = 0
+    for s in sentences:
+        first_break = s.find(" ")
+        if first_break != -1:
+            count += len(_CAPS_RUN_RE.findall(s, first_break + 1))
+    return count
+
+
+def _sentence_polarities(sentences: list[str], cache: dict) -> list[float]:
+    """Polarity of each sentence, memoized by sentence text in cache."""
+    polarities = []
+    for s in sentences:
+        polarity = cache.get(s)
+        if polarity is None:
+            polarity = cache[s] = _pattern_sentiment(s)[0]
+        polarities.append(polarity)
+    return polarities
 
 
 def _variance(values: list[float]) -> float:
     """Calculate variance of a list of numbers."""
-    if len(values) < 2:
+    n = len(values)
+    if n < 2:
         return 0.0
-    mean = sum(values) / len(values)
-    return sum((x - mean) ** 2 for x in values) / len(values)
+    mean = sum(values) / n
+    # List comp + multiply: no generator frames or float pow per element
+    return sum([(x - mean) * (x - mean) for x in values]) / n
 
 
 def _duration_bonus(duration: float, target: float = 45.0) -> float:
@@ -380,13 +513,11 @@ def _duration_bonus(duration: float, target: float = 45.0) -> float:
     return bonus
 
 
+# Label thresholds: a score at or above _LABEL_THRESHOLDS[i] earns _LABELS[i + 1]
+_LABEL_THRESHOLDS = (3.0, 5.0, 7.0)
+_LABELS = ("💤 Meh", "👍 Good", "⭐ Great", "🔥 Viral")
+
+
 def _label_from_score(score: float) -> str:
     """Convert a numeric score to a human-readable engagement label."""
-    if score >= 7.0:
-        return "🔥 Viral"
-    elif score >= 5.0:
-        return "⭐ Great"
-    elif score >= 3.0:
-        return "👍 Good"
-    else:
-        return "💤 Meh"
+    return _LABELS[bisect_right(_LABEL_THRESHOLDS, score)]
@@ -17,6 +17,8 @@ Strategy:
 """
 
 import re
+from functools import lru_cache
+
 from textblob import TextBlob
 
 
@@ -61,7 +63,7 @@ def generate_title(text: str) -> str:
     if not text or not text.strip():
         return "Untitled Clip"
 
-    blob = TextBlob(text.strip())
+    blob = _parse(text.strip())
     sentences = [str(s).strip() for s in blob.sentences if len(str(s).strip()) > 5]
 
     if not sentences:
@@ -86,8 +88,7 @@ def generate_title(text: str) -> str:
     best_sent = sentences[0]
     best_np_count = 0
     for sent in sentences[:8]:  # check first 8 sentences
-        sent_blob = TextBlob(sent)
-        np_count = len(sent_blob.noun_phrases)
+        np_count = len(_parse(sent).noun_phrases)
         if np_count > best_np_count:
             best_np_count = np_count
             best_sent = sent
@@ -109,7 +110,7 @@ def generate_description(text: str, video_title: str = "") -> str:
     if not text or not text.strip():
         return "Generated by Slippa"
 
-    blob = TextBlob(text.strip())
+    blob = _parse(text.strip())
     sentences = [str(s).strip() for s in blob.sentences if len(str(s).strip()) > 10]
 
     # Summary: first 2-3 sentences, capped at 280 chars
@@ -149,6 +150,16 @@ def generate_description(text: str, video_title: str = "") -> str:
     return description
 
 
+@lru_cache(maxsize=128)
+def _parse(text: str) -> TextBlob:
+    """
+    Shared TextBlob per text. TextBlob caches its sentences and noun
+    phrases, so generate_title and generate_description on the same clip
+    run the (slow, NLTK-backed) tokenizer and tagger only once.
+    """
+    return TextBlob(text)
+
+
 def _generate_hashtags(blob: TextBlob) -> list[str]:
     """Extract hashtags from noun phrases."""
     noun_phrases = blob.noun_phrases
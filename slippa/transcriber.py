@@ -11,6 +11,10 @@ The transcription output includes word-level timestamps, which we use
 in the clipper module to find good clip boundaries.
 """
 
+import os
+import threading
+
+import ctranslate2
 from faster_whisper import WhisperModel
 
 
@@ -22,6 +26,17 @@ from faster_whisper import WhisperModel
 #   "large-v3"— best quality (~10GB RAM)
 DEFAULT_MODEL_SIZE = "base"
 
+# Inference device: "cuda" (float16) or "cpu" (int8). Auto-detected;
+# set SLIPPA_WHISPER_DEVICE=cpu to force CPU (e.g. for debugging).
+DEVICE_ENV_VAR = "SLIPPA_WHISPER_DEVICE"
+COMPUTE_TYPES = {"cuda": "float16", "cpu": "int8"}
+
+# Loaded models, kept for the life of the process so repeated jobs skip
+# the (slow) weight load. The lock stops concurrent jobs loading the same
+# model twice.
+_MODEL_CACHE: dict[tuple[str, str], WhisperModel] = {}
+_MODEL_LOCK = threading.Lock()
+
 
 def transcribe_audio(
     video_path: str,
@@ -43,8 +58,10 @@ def transcribe_audio(
     How it works:
         1. WhisperModel loads the specified model into memory.
            - On first run, it downloads the model (~150MB for 'base').
-           - On subsequent runs, it uses the cached model.
-           - 'compute_type="int8"' uses quantization to reduce memory usage.
+           - Once loaded, the model is kept in memory and reused by
+             later calls with the same model_size.
+           - On a CUDA GPU it runs in float16; on CPU,
+             'compute_type="int8"' uses quantization to reduce memory usage.
 
         2. model.transcribe() processes the audio:
            - Whisper internally extracts audio from the video file.
@@ -53,9 +70,22 @@ def transcribe_audio(
 
         3. We convert the segments into simple dictionaries for easy use
            in the rest of the pipeline.
+
+    To process segments as Whisper produces them instead of waiting for
+    the whole list, use iter_segments().
     """
-    print(f"  Loading Whisper model: {model_size}")
-    model = WhisperModel(model_size, compute_type="int8")
+    return list(iter_segments(video_path, model_size))
+
+
+def iter_segments(
+    video_path: str,
+    model_size: str = DEFAULT_MODEL_SIZE,
+):
+    """
+    Like transcribe_audio, but yields each segment dict as soon as Whisper
+    decodes it (transcription runs as the generator is consumed).
+    """
+    model = _get_model(model_size)
 
     print("  Transcribing...")
     segments_generator, info = model.transcribe(
@@ -67,9 +97,8 @@ def transcribe_audio(
 
     print(f"  Detected language: {info.language} (confidence: {info.language_probability:.0%})")
 
-    # Convert generator to list of dicts
+    # Convert each segment to a dict
     # Each segment now includes word-level timing when available
-    segments = []
     for segment in segments_generator:
         words = []
         if segment.words:
@@ -80,11 +109,39 @@ def transcribe_audio(
                     "end": w.end,
                 })
 
-        segments.append({
+        yield {
             "start": segment.start,
             "end": segment.end,
             "text": segment.text.strip(),
             "words": words,
-        })
-
-    return segments
+        }
+
+
+def _get_model(model_size: str) -> WhisperModel:
+    """Return the loaded model for model_size, loading it on first use."""
+    device = _pick_device()
+    key = (model_size, device)
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            compute_type = COMPUTE_TYPES[device]
+            print(f"  Loading Whisper model: {model_size} ({device}, {compute_type})")
+            # Default num_workers=1: each process transcribes one file at a
+            # time (the web app runs them in a single transcribe worker), so
+            # extra CTranslate2 workers would only hold more memory
+            model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            _MODEL_CACHE[key] = model
+        else:
+            print(f"  Using loaded Whisper model: {model_size}")
+        return model
+
+
+def _pick_device() -> str:
+    """Use CUDA when a GPU is visible, unless overridden via the env var."""
+    forced = os.environ.get(DEVICE_ENV_VAR, "").strip().lower()
+    if forced in COMPUTE_TYPES:
+        return forced
+    try:
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except RuntimeError:
+        return "cpu"
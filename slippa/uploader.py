@@ -19,6 +19,8 @@ Privacy: Uploads default to "private" so nothing goes public accidentally.
 """
 
 import os
+import threading
+from collections.abc import Callable
 
 import google_auth_oauthlib.flow
 import googleapiclient.discovery
@@ -37,6 +39,17 @@ API_VERSION = "v3"
 CLIENT_SECRETS_FILE = "client_secrets.json"
 TOKEN_FILE = "token.json"
 
+# Resumable upload chunk size (must be a multiple of 256 KB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Concurrent uploads from the web UI — uploads are network-bound
+MAX_PARALLEL_UPLOADS = 4
+
+# Credentials loaded from TOKEN_FILE, kept in memory so repeated uploads
+# don't re-read and re-parse the token. Refreshed in place when expired.
+_CREDS = None
+_CREDS_LOCK = threading.Lock()
+
 
 def is_configured() -> bool:
     """
@@ -50,6 +63,8 @@ def is_authenticated() -> bool:
     """
     Check if we already have a valid token (user has logged in before).
     """
+    if _CREDS is not None and _CREDS.valid:
+        return True
     if not os.path.exists(TOKEN_FILE):
         return False
     try:
@@ -108,35 +123,58 @@ def handle_oauth_callback(authorization_response_url: str) -> bool:
     creds = flow.credentials
 
     # Save the token for future use
+    _save_token(creds)
+
+    return True
+
+
+def _save_token(creds: Credentials):
+    """Write creds to TOKEN_FILE and make them the in-memory credentials."""
+    global _CREDS
     with open(TOKEN_FILE, "w") as f:
         f.write(creds.to_json())
+    _CREDS = creds
 
-    return True
+
+def _get_credentials() -> Credentials:
+    """
+    Return the saved credentials, loading TOKEN_FILE only on first use
+    and refreshing (and re-saving) them only when they've expired.
+    """
+    global _CREDS
+    with _CREDS_LOCK:
+        creds = _CREDS
+        if creds is None and os.path.exists(TOKEN_FILE):
+            creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                # Save refreshed token
+                _save_token(creds)
+            else:
+                raise RuntimeError(
+                    "Not authenticated. Please log in via the web UI first."
+                )
+
+        _CREDS = creds
+        return creds
 
 
 def _get_youtube_service():
     """
     Build an authenticated YouTube API service.
     Uses saved token, refreshes if expired.
-    """
-    creds = None
-
-    if os.path.exists(TOKEN_FILE):
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            # Save refreshed token
-            with open(TOKEN_FILE, "w") as f:
-                f.write(creds.to_json())
-        else:
-            raise RuntimeError(
-                "Not authenticated. Please log in via the web UI first."
-            )
 
+    A fresh service per call (the underlying HTTP client isn't thread-safe),
+    but built from the bundled discovery document — no network fetch.
+    """
     return googleapiclient.discovery.build(
-        API_SERVICE_NAME, API_VERSION, credentials=creds
+        API_SERVICE_NAME,
+        API_VERSION,
+        credentials=_get_credentials(),
+        cache_discovery=False,
+        static_discovery=True,
     )
 
 
@@ -147,6 +185,9 @@ def upload_video(
     tags: list[str] | None = None,
     privacy_status: str = "private",
     category_id: str = "22",
+    chunksize: int = UPLOAD_CHUNK_SIZE,
+    verbose: bool = True,
+    on_progress: Callable[[float], None] | None = None,
 ) -> dict:
     """
     Upload a video to YouTube.
@@ -158,6 +199,10 @@ def upload_video(
         tags: List of tags.
         privacy_status: 'private', 'public', or 'unlisted'.
         category_id: YouTube category ('22' = People & Blogs).
+        chunksize: Bytes per resumable-upload request (-1 = whole file).
+        verbose: Print per-chunk progress.
+        on_progress: Called with the uploaded fraction (0.0–1.0) after
+                     each chunk, e.g. to report progress to the web UI.
 
     Returns:
         dict: Upload result with 'id', 'title', 'status' keys.
@@ -167,8 +212,9 @@ def upload_video(
            (title, description, tags, privacy).
         2. We create a MediaFileUpload for the video file:
            - resumable=True: if upload is interrupted, it can continue.
-           - chunksize=-1: upload the entire file in one request
-             (simpler for small clips).
+           - chunksize: the file goes up in 8 MB requests, so an
+             interrupted upload only re-sends the current chunk, and
+             only one chunk is held in memory at a time.
         3. We call youtube.videos().insert() to start the upload.
         4. We loop calling next_chunk() until the upload completes.
         5. YouTube returns the video ID on success.
@@ -189,7 +235,7 @@ def upload_video(
 
     media = googleapiclient.http.MediaFileUpload(
         file_path,
-        chunksize=-1,
+        chunksize=chunksize,
         resumable=True,
     )
 
@@ -205,8 +251,10 @@ def upload_video(
     while response is None:
         status, response = request_obj.next_chunk()
         if status:
-            progress = int(status.progress() * 100)
-            print(f"  Upload progress: {progress}%")
+            if on_progress is not None:
+                on_progress(status.progress())
+            if verbose:
+                print(f"  Upload progress: {int(status.progress() * 100)}%")
 
     video_id = response["id"]
     print(f"  ✅ Uploaded! Video ID: {video_id}")
@@ -20,14 +20,27 @@ Routes:
 
 import os
 import json
+import mimetypes
 import time
 import uuid
 import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
+from urllib.parse import quote
 from flask import (
     Flask, render_template, request, jsonify,
-    send_from_directory, redirect, url_for, Response
+    send_from_directory, redirect, url_for, Response, abort
 )
+from werkzeug.security import safe_join
+
+try:
+    import orjson
+except ImportError:  # optional speedup — jsonify works fine
+    orjson = None
 
 from slippa.downloader import download_video
 from slippa.transcriber import transcribe_audio
@@ -35,6 +48,8 @@ from slippa.clipper import find_clips
 from slippa.cutter import cut_clips
 from slippa.titler import generate_title, generate_description
 from slippa import uploader
+from slippa import cache
+from slippa import URL_PREFIXES
 from slippa import database as db
 from config import settings as config
 
@@ -47,103 +62,335 @@ app = Flask(
 # Initialise database on import
 db.init_db()
 
-# In-memory cache for active processing threads + upload jobs
-_active_jobs = {}
+# Behind nginx, set SLIPPA_ACCEL_REDIRECT to an internal location aliasing
+# the clips dir (e.g. "/_clips/"). Clip routes then only validate the path
+# and hand the file to nginx via X-Accel-Redirect, which serves it with
+# sendfile(2) instead of streaming it through Python.
+ACCEL_REDIRECT_PREFIX = os.environ.get("SLIPPA_ACCEL_REDIRECT", "")
+
+# The UI has no authentication and accepts local file paths, so it only
+# listens on loopback unless SLIPPA_HOST says otherwise (the Docker image
+# sets 0.0.0.0 so the published port works)
+HOST = os.environ.get("SLIPPA_HOST", "127.0.0.1")
+
+# A clip never changes once cut (every job gets a fresh id and folder),
+# so browsers may keep it for good and skip even revalidation.
+CLIP_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _json(obj, status=200):
+    """JSON response for the polled endpoints, serialized with orjson when available."""
+    if orjson is None:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+def _sse_event(obj) -> str:
+    """One SSE data event, serialized like _json so both transports match."""
+    data = orjson.dumps(obj).decode("utf-8") if orjson is not None else json.dumps(obj)
+    return f"data: {data}\n\n"
+
+
+@lru_cache(maxsize=8)
+def _clips_base(clips_dir: str) -> str:
+    """Absolute clips directory, resolved once per configured clips_dir."""
+    return os.path.abspath(clips_dir)
+
+
+# In-memory upload job state. Finished uploads are dropped after
+# UPLOAD_JOB_TTL seconds — long after the UI has stopped polling them.
+UPLOAD_JOB_TTL = 3600
 upload_jobs = {}
+_upload_finished = {}  # upload_id -> time.monotonic() when it finished
+_upload_jobs_lock = threading.Lock()
+# Notified on every upload state change, waking /upload-stream listeners
+_upload_changed = threading.Condition(_upload_jobs_lock)
+
+# Uploads run on a shared, bounded thread pool instead of a new thread
+# per request; extra uploads wait their turn in the pool's queue.
+_upload_executor = ThreadPoolExecutor(
+    max_workers=uploader.MAX_PARALLEL_UPLOADS, thread_name_prefix="upload",
+)
 
 
-def _process_video(job_id: str, source: str):
-    """Background thread: runs the full pipeline for one video."""
-    settings = config.load_settings()
+def _set_upload_progress(upload_id: str, progress: str):
+    """Update a running upload's progress text."""
+    with _upload_changed:
+        upload_jobs[upload_id]["progress"] = progress
+        _upload_changed.notify_all()
+
+
+def _finish_upload(upload_id: str, state: dict):
+    """Record an upload's final state and when it finished."""
+    with _upload_changed:
+        upload_jobs[upload_id] = state
+        _upload_finished[upload_id] = time.monotonic()
+        _upload_changed.notify_all()
+
+
+def _prune_upload_jobs():
+    """Drop finished upload jobs older than UPLOAD_JOB_TTL."""
+    cutoff = time.monotonic() - UPLOAD_JOB_TTL
+    with _upload_jobs_lock:
+        expired = [uid for uid, t in _upload_finished.items() if t < cutoff]
+        for upload_id in expired:
+            del _upload_finished[upload_id]
+            upload_jobs.pop(upload_id, None)
+
+
+# Pipeline jobs run their CPU-bound stages (scoring, transcript analysis,
+# cutting) in worker processes, so concurrent jobs don't contend for one
+# GIL. Job state lives in SQLite, which every process can read and write.
+# Workers are spawned (not forked) — forking a threaded server is unsafe.
+PIPELINE_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Whisper runs in its own pool: each of its processes keeps a loaded model
+# resident for reuse, so one worker means one model copy in memory. The
+# model already uses every core (or the GPU), so a second concurrent
+# transcription would only add memory.
+TRANSCRIBE_WORKERS = 1
+
+# Each job is driven by a light thread that hands its stages to the pools.
+# Enough threads to keep every pipeline worker and transcriber busy.
+_job_runner = ThreadPoolExecutor(
+    max_workers=PIPELINE_WORKERS + TRANSCRIBE_WORKERS, thread_name_prefix="job",
+)
+
+_POOL_SIZES = {"pipeline": PIPELINE_WORKERS, "transcribe": TRANSCRIBE_WORKERS}
+_pools: dict[str, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
 
+
+def _get_pool(name: str) -> ProcessPoolExecutor:
+    """Return the named worker pool, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=_POOL_SIZES[name],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pools[name] = pool
+        return pool
+
+
+def _discard_pool(name: str, pool: ProcessPoolExecutor):
+    """Drop a broken pool (a worker died), so the next stage gets a fresh one."""
+    with _pools_lock:
+        if _pools.get(name) is pool:
+            del _pools[name]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_pool(name: str, fn, *args):
+    """Run fn(*args) in the named worker pool and return its result.
+
+    A pool whose worker died (e.g. killed for running out of memory) is
+    permanently broken; it is replaced, and the stage that was running
+    in it fails with BrokenProcessPool.
+    """
+    pool = _get_pool(name)
+    try:
+        future = pool.submit(_stage, fn, *args)
+    except BrokenProcessPool:
+        # Broke under another job before this submit — retry on a new pool
+        _discard_pool(name, pool)
+        pool = _get_pool(name)
+        future = pool.submit(_stage, fn, *args)
     try:
-        # Step 1: Download
-        db.update_job(job_id, status="downloading", progress="Downloading video...", percent=10)
+        return future.result()
+    except BrokenProcessPool:
+        _discard_pool(name, pool)
+        raise
 
-        if source.startswith(("http://", "https://", "www.")):
-            video_path = download_video(source, output_dir=settings["download_dir"])
-        else:
-            video_path = source
 
-        title = os.path.splitext(os.path.basename(video_path))[0]
-        db.update_job(job_id, video_title=title, progress=f"Downloaded: {title}", percent=20)
+def _stage(fn, *args):
+    """Worker process: run one stage, then write out its job updates.
+
+    update_job() batches writes per process; flushing before returning
+    keeps them from landing after the next stage's updates.
+    """
+    try:
+        return fn(*args)
+    finally:
+        db.flush()
+
+
+def _submit_job(job_id: str, source: str) -> Future:
+    """Start a job's pipeline; the future completes when the job ends."""
+    return _job_runner.submit(_run_job, job_id, source)
+
+
+@dataclass(slots=True)
+class ClipInfo:
+    """A cut clip as shown on the results page (stored as a JSON object)."""
+    index: int
+    filename: str
+    start: float
+    end: float
+    duration: float
+    score: float
+    label: str
+    score_breakdown: dict = field(default_factory=dict)
+    text: str = ""
+    auto_title: str = ""
+    auto_description: str = ""
+    size_kb: float = 0.0
+
+
+def _run_job(job_id: str, source: str):
+    """Job thread: runs the full pipeline for one video, stage by stage.
+
+    Download, transcription and clip analysis results are cached (see
+    slippa.cache), so re-submitting a video skips the stages it can.
+    """
+    settings = config.load_settings()
+
+    try:
+        video_path, title, transcript_key, segments = _run_in_pool(
+            "pipeline", _download_stage, job_id, source, settings,
+        )
 
-        # Step 2: Transcribe
+        # Step 2: Transcribe (skipped when the transcript is cached)
         db.update_job(job_id, status="transcribing",
                       progress=f"Transcribing with Whisper ({settings['whisper_model']})...", percent=30)
-
-        segments = transcribe_audio(video_path, model_size=settings["whisper_model"])
+        if segments is None:
+            segments = _run_in_pool(
+                "transcribe", _transcribe_stage,
+                video_path, settings["whisper_model"], transcript_key,
+            )
         db.update_job(job_id, progress=f"Transcribed {len(segments)} segments", percent=50)
+        # Write it out now, or it could land after the worker's final status
+        db.flush(job_id)
 
-        # Step 3: Find clips
-        smart_scoring = settings.get("smart_scoring", True)
-        scoring_mode = "smart AI" if smart_scoring else "legacy"
-        db.update_job(job_id, status="analyzing",
-                      progress=f"Analyzing transcript ({scoring_mode} scoring)...", percent=60)
-
-        clips = find_clips(
-            segments,
-            min_duration=settings["min_clip_duration"],
-            max_duration=settings["max_clip_duration"],
-            max_clips=settings["max_clips"],
-            smart_edit=settings.get("smart_edit", False),
-            gap_threshold=settings.get("gap_threshold", 0.8),
-            smart_scoring=smart_scoring,
+        _run_in_pool(
+            "pipeline", _clip_stage,
+            job_id, video_path, title, segments, transcript_key, settings,
         )
-        db.update_job(job_id, progress=f"Found {len(clips)} clips", percent=70)
+    except Exception as e:
+        db.update_job(job_id, status="error", progress=f"Error: {str(e)}", error=str(e))
 
-        if not clips:
-            db.update_job(job_id, status="done",
-                          progress="No clips found in this video.", clips=[], percent=100)
-            return
 
-        # Step 4: Cut clips
-        db.update_job(job_id, status="cutting",
-                      progress="Cutting clips with ffmpeg...", percent=80)
+def _download_stage(job_id: str, source: str, settings: dict):
+    """Worker process: fetch the video and look up a cached transcript.
 
-        clip_output_dir = os.path.join(settings["clips_dir"], job_id)
-        clip_paths = cut_clips(
-            video_path, clips,
-            output_dir=clip_output_dir,
-            smart_edit=settings.get("smart_edit", False),
-            output_format=settings.get("output_format", "horizontal"),
-        )
+    Returns (video_path, title, transcript_key, segments), where segments
+    is None unless the transcript is already cached.
+    """
+    # Step 1: Download
+    db.update_job(job_id, status="downloading", progress="Downloading video...", percent=10)
 
-        auto_titles = settings.get("auto_titles", True)
-
-        clip_info = []
-        for i, (path, clip_data) in enumerate(zip(clip_paths, clips)):
-            duration = clip_data["end"] - clip_data["start"]
-            clip_text = clip_data.get("text", "")
-
-            # Auto-generate title and description
-            if auto_titles and clip_text:
-                auto_title = generate_title(clip_text)
-                auto_desc = generate_description(clip_text, title)
-            else:
-                auto_title = f"Clip {i + 1}"
-                auto_desc = f"Clip from {title} — Generated by Slippa"
-
-            clip_info.append({
-                "index": i + 1,
-                "filename": os.path.basename(path),
-                "start": round(clip_data["start"], 1),
-                "end": round(clip_data["end"], 1),
-                "duration": round(duration, 1),
-                "score": clip_data["score"],
-                "label": clip_data.get("label", "—"),
-                "score_breakdown": clip_data.get("score_breakdown", {}),
-                "text": clip_text[:200],
-                "auto_title": auto_title,
-                "auto_description": auto_desc,
-                "size_kb": round(os.path.getsize(path) / 1024, 1),
-            })
+    if source.startswith(URL_PREFIXES):
+        download_key = cache.make_key(source, os.path.abspath(settings["download_dir"]))
+        cached = cache.get("downloads", download_key)
+        if isinstance(cached, list) and os.path.exists(cached[0]):
+            video_path, title = cached
+        else:
+            video_path, title = download_video(source, output_dir=settings["download_dir"])
+            cache.put("downloads", download_key, [video_path, title])
+    else:
+        video_path = source
+        title = os.path.splitext(os.path.basename(video_path))[0]
 
+    db.update_job(job_id, video_title=title, progress=f"Downloaded: {title}", percent=20)
+
+    transcript_key = cache.make_key(cache.file_key(video_path), settings["whisper_model"])
+    return video_path, title, transcript_key, cache.get("transcripts", transcript_key)
+
+
+def _transcribe_stage(video_path: str, model_size: str, transcript_key: str) -> list[dict]:
+    """Transcribe worker: transcribe the video and cache the transcript."""
+    segments = transcribe_audio(video_path, model_size=model_size)
+    cache.put("transcripts", transcript_key, segments)
+    return segments
+
+
+def _clip_stage(
+    job_id: str,
+    video_path: str,
+    title: str,
+    segments: list[dict],
+    transcript_key: str,
+    settings: dict,
+):
+    """Worker process: find, cut and title the clips, then finish the job."""
+    # Step 3: Find clips
+    smart_scoring = settings.get("smart_scoring", True)
+    scoring_mode = "smart AI" if smart_scoring else "legacy"
+    db.update_job(job_id, status="analyzing",
+                  progress=f"Analyzing transcript ({scoring_mode} scoring)...", percent=60)
+
+    clip_options = dict(
+        min_duration=settings["min_clip_duration"],
+        max_duration=settings["max_clip_duration"],
+        max_clips=settings["max_clips"],
+        smart_edit=settings.get("smart_edit", False),
+        gap_threshold=settings.get("gap_threshold", 0.8),
+        smart_scoring=smart_scoring,
+    )
+    clips_key = cache.make_key(transcript_key, clip_options)
+    clips = cache.get("clips", clips_key)
+    if clips is None:
+        clips = find_clips(segments, **clip_options)
+        cache.put("clips", clips_key, clips)
+    db.update_job(job_id, progress=f"Found {len(clips)} clips", percent=70)
+
+    if not clips:
         db.update_job(job_id, status="done",
-                      progress=f"Done! {len(clip_info)} clips ready.", clips=clip_info, percent=100)
+                      progress="No clips found in this video.", clips=[], percent=100)
+        return
+
+    # Step 4: Cut clips
+    db.update_job(job_id, status="cutting",
+                  progress="Cutting clips with ffmpeg...", percent=80)
+
+    clip_output_dir = os.path.join(settings["clips_dir"], job_id)
+    clip_paths = cut_clips(
+        video_path, clips,
+        output_dir=clip_output_dir,
+        smart_edit=settings.get("smart_edit", False),
+        output_format=settings.get("output_format", "horizontal"),
+    )
 
-    except Exception as e:
-        db.update_job(job_id, status="error", progress=f"Error: {str(e)}", error=str(e))
+    auto_titles = settings.get("auto_titles", True)
+
+    # One directory read for every clip's size instead of a stat per clip
+    with os.scandir(clip_output_dir) as entries:
+        sizes = {e.name: e.stat(follow_symlinks=False).st_size for e in entries}
+
+    clip_info = []
+    for i, (path, clip_data) in enumerate(zip(clip_paths, clips)):
+        name = os.path.basename(path)
+        duration = clip_data["end"] - clip_data["start"]
+        clip_text = clip_data.get("text", "")
+
+        # Auto-generate title and description
+        if auto_titles and clip_text:
+            auto_title = generate_title(clip_text)
+            auto_desc = generate_description(clip_text, title)
+        else:
+            auto_title = f"Clip {i + 1}"
+            auto_desc = f"Clip from {title} — Generated by Slippa"
+
+        clip_info.append(ClipInfo(
+            index=i + 1,
+            filename=name,
+            start=round(clip_data["start"], 1),
+            end=round(clip_data["end"], 1),
+            duration=round(duration, 1),
+            score=clip_data["score"],
+            label=clip_data.get("label", "—"),
+            score_breakdown=clip_data.get("score_breakdown", {}),
+            text=clip_text[:200],
+            auto_title=auto_title,
+            auto_description=auto_desc,
+            size_kb=round(sizes.get(name, 0) / 1024, 1),
+        ))
+
+    db.update_job(job_id, status="done",
+                  progress=f"Done! {len(clip_info)} clips ready.", clips=clip_info, percent=100)
 
 
 # ---- Page Routes ----
@@ -189,6 +436,7 @@ def save_settings_route():
         "default_privacy": request.form.get("default_privacy", "private"),
         "smart_scoring": request.form.get("smart_scoring") == "on",
         "auto_titles": request.form.get("auto_titles") == "on",
+        "batch_concurrency": int(request.form.get("batch_concurrency", 3)),
     }
     current = config.load_settings()
     current.update(new_settings)
@@ -202,16 +450,13 @@ def save_settings_route():
 def process():
     source = request.form.get("source", "").strip()
     if not source:
-        return jsonify({"error": "No source provided"}), 400
+        return _json({"error": "No source provided"}, 400)
 
     job_id = str(uuid.uuid4())[:8]
     db.create_job(job_id, source)
+    _submit_job(job_id, source)
 
-    thread = threading.Thread(target=_process_video, args=(job_id, source))
-    thread.daemon = True
-    thread.start()
-
-    return jsonify({"job_id": job_id})
+    return _json({"job_id": job_id})
 
 
 @app.route("/batch-process", methods=["POST"])
@@ -219,11 +464,11 @@ def batch_process():
     """Process multiple URLs at once."""
     urls_text = request.form.get("urls", "").strip()
     if not urls_text:
-        return jsonify({"error": "No URLs provided"}), 400
+        return _json({"error": "No URLs provided"}, 400)
 
     urls = [u.strip() for u in urls_text.splitlines() if u.strip()]
     if not urls:
-        return jsonify({"error": "No valid URLs found"}), 400
+        return _json({"error": "No valid URLs found"}, 400)
 
     job_ids = []
     for url in urls:
@@ -231,25 +476,51 @@ def batch_process():
         db.create_job(job_id, url, batch=True)
         job_ids.append(job_id)
 
-    # Process sequentially in a background thread
+    # Feed the worker pool from a background thread, keeping at most
+    # batch_concurrency of this batch's videos in flight
+    concurrency = max(1, config.get("batch_concurrency"))
+
     def _batch_runner(ids):
-        for jid in ids:
-            job = db.get_job(jid)
-            _process_video(jid, job["source"])
+        in_flight = threading.BoundedSemaphore(concurrency)
+        for n, jid in enumerate(ids):
+            in_flight.acquire()
+            try:
+                job = db.get_job(jid)
+                _submit_job(jid, job["source"]).add_done_callback(
+                    lambda _: in_flight.release()
+                )
+            except Exception as e:
+                # Don't leave the rest of the batch stuck as "queued"
+                for rest in ids[n:]:
+                    db.update_job(rest, status="error",
+                                  progress=f"Error: {str(e)}", error=str(e))
+                return
 
     thread = threading.Thread(target=_batch_runner, args=(job_ids,))
     thread.daemon = True
     thread.start()
 
-    return jsonify({"job_ids": job_ids})
+    return _json({"job_ids": job_ids})
 
 
 @app.route("/status/<job_id>")
 def status(job_id):
-    job = db.get_job(job_id)
-    if not job:
-        return jsonify({"error": "Job not found"}), 404
-    return jsonify(job)
+    # Compare revisions first, so an unchanged job costs one tiny query
+    # and an empty 304 instead of loading and serializing the whole job
+    rev = db.get_job_rev(job_id)
+    if rev is None:
+        return _json({"error": "Job not found"}, 404)
+    if request.if_none_match.contains(f"{job_id}-{rev}"):
+        response = Response(status=304)
+    else:
+        job = db.get_job(job_id)
+        if not job:
+            return _json({"error": "Job not found"}, 404)
+        response = _json(job)
+        rev = job["rev"]
+    response.set_etag(f"{job_id}-{rev}")
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.route("/stream/<job_id>")
@@ -260,7 +531,7 @@ def stream(job_id):
         while True:
             job = db.get_job(job_id)
             if not job:
-                yield f"data: {json.dumps({'error': 'Job not found'})}\n\n"
+                yield _sse_event({"error": "Job not found"})
                 break
             # Only send when something changed
             current = (job["status"], job["progress"], job.get("percent", 0))
@@ -273,7 +544,7 @@ def stream(job_id):
                     "video_title": job.get("video_title", ""),
                     "clips": job.get("clips", []),
                 }
-                yield f"data: {json.dumps(payload)}\n\n"
+                yield _sse_event(payload)
             if job["status"] in ("done", "error"):
                 break
             time.sleep(0.8)
@@ -291,23 +562,50 @@ def results(job_id):
 
 @app.route("/clips/<job_id>/<filename>")
 def serve_clip(job_id, filename):
-    settings = config.load_settings()
-    clip_dir = os.path.join(os.getcwd(), settings["clips_dir"], job_id)
-    return send_from_directory(clip_dir, filename)
+    return _send_clip(job_id, filename)
 
 
 @app.route("/download/<job_id>/<filename>")
 def download_clip(job_id, filename):
-    settings = config.load_settings()
-    clip_dir = os.path.join(os.getcwd(), settings["clips_dir"], job_id)
-    return send_from_directory(clip_dir, filename, as_attachment=True)
+    return _send_clip(job_id, filename, as_attachment=True)
+
+
+def _send_clip(job_id: str, filename: str, as_attachment: bool = False):
+    """Serve a clip file, offloading the transfer to nginx when configured."""
+    clips_base = _clips_base(config.load_settings()["clips_dir"])
+
+    if ACCEL_REDIRECT_PREFIX:
+        path = safe_join(clips_base, job_id, filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        response = Response(mimetype=mimetype)
+        response.headers["X-Accel-Redirect"] = (
+            f"{ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(job_id)}/{quote(filename)}"
+        )
+        if as_attachment:
+            response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response.headers["Cache-Control"] = CLIP_CACHE_CONTROL
+        return response
+
+    # send_file hands the open file to the server's wsgi.file_wrapper when
+    # it provides one (gunicorn and waitress send it without Python copies).
+    # conditional=True answers Range requests with 206 partial content, so
+    # seeking in a <video> preview only fetches the bytes it needs.
+    clip_dir = os.path.join(clips_base, job_id)
+    response = send_from_directory(
+        clip_dir, filename, as_attachment=as_attachment,
+        conditional=True, etag=True,
+    )
+    response.headers["Cache-Control"] = CLIP_CACHE_CONTROL
+    return response
 
 
 # ---- YouTube Upload Routes ----
 
 @app.route("/youtube/status")
 def youtube_status():
-    return jsonify({
+    return _json({
         "configured": uploader.is_configured(),
         "authenticated": uploader.is_authenticated(),
     })
@@ -346,26 +644,32 @@ def upload_clip_to_youtube():
     if not uploader.is_authenticated():
         return jsonify({"error": "Not authenticated.", "need_auth": True}), 401
 
-    clip_path = os.path.join(os.getcwd(), config.load_settings()["clips_dir"], job_id, filename)
+    clip_path = os.path.join(_clips_base(config.load_settings()["clips_dir"]), job_id, filename)
     if not os.path.exists(clip_path):
         return jsonify({"error": "Clip file not found"}), 404
 
+    _prune_upload_jobs()
     upload_id = f"{job_id}_{filename}"
-    upload_jobs[upload_id] = {"status": "uploading", "progress": "Starting...", "result": None}
+    with _upload_changed:
+        _upload_finished.pop(upload_id, None)
+        upload_jobs[upload_id] = {"status": "uploading", "progress": "Starting...", "result": None}
+        _upload_changed.notify_all()
+
+    def _on_progress(fraction):
+        _set_upload_progress(upload_id, f"Uploading... {int(fraction * 100)}%")
 
     def _do_upload():
         try:
             result = uploader.upload_video(
                 file_path=clip_path, title=title,
                 description=description, privacy_status=privacy,
+                on_progress=_on_progress,
             )
-            upload_jobs[upload_id] = {"status": "done", "progress": "Uploaded!", "result": result}
+            _finish_upload(upload_id, {"status": "done", "progress": "Uploaded!", "result": result})
         except Exception as e:
-            upload_jobs[upload_id] = {"status": "error", "progress": str(e), "result": None}
+            _finish_upload(upload_id, {"status": "error", "progress": str(e), "result": None})
 
-    thread = threading.Thread(target=_do_upload)
-    thread.daemon = True
-    thread.start()
+    _upload_executor.submit(_do_upload)
     return jsonify({"upload_id": upload_id})
 
 
@@ -373,17 +677,73 @@ def upload_clip_to_youtube():
 def upload_status(upload_id):
     job = upload_jobs.get(upload_id)
     if not job:
-        return jsonify({"error": "Upload not found"}), 404
-    return jsonify(job)
+        return _json({"error": "Upload not found"}, 404)
+    return _json(job)
+
+
+@app.route("/upload-stream/<upload_id>")
+def upload_stream(upload_id):
+    """SSE endpoint — pushes an upload's state each time it changes."""
+    last = None
+
+    def changed():
+        job = upload_jobs.get(upload_id)
+        return job is None or job != last
+
+    def generate():
+        nonlocal last
+        while True:
+            with _upload_changed:
+                # Wake on a change; the timeout bounds how long a dropped
+                # client can hold this thread before the keep-alive fails
+                _upload_changed.wait_for(changed, timeout=15)
+                job = upload_jobs.get(upload_id)
+                current = dict(job) if job else None
+            if current is None:
+                yield _sse_event({"error": "Upload not found"})
+                break
+            if current == last:
+                yield ": keep-alive\n\n"
+                continue
+            last = current
+            yield _sse_event(current)
+            if current["status"] in ("done", "error"):
+                break
+    return Response(generate(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
 # ---- Server ----
 
+# Request-handling threads for the production server. Each open /stream or
+# /upload-stream (Server-Sent Events) connection holds one for the life of
+# its job or upload.
+WEB_THREADS = 16
+
+
 def run_web():
+    """
+    Serve the web UI on port 5000, on the SLIPPA_HOST interface.
+
+    Uses waitress (multi-threaded, keep-alive) unless SLIPPA_DEV is set or
+    waitress isn't installed, in which case Flask's debug server is used.
+    For gunicorn instead:  gunicorn -k gthread --threads 8 slippa.web:app
+    """
     yt_status = "✅ configured" if uploader.is_configured() else "❌ no client_secrets.json"
-    print(f"\n🌐 Slippa Web UI running at: http://localhost:5000")
+    display_host = "localhost" if HOST in ("127.0.0.1", "0.0.0.0") else HOST
+    print(f"\n🌐 Slippa Web UI running at: http://{display_host}:5000")
     print(f"📤 YouTube upload: {yt_status}\n")
-    app.run(debug=True, port=5000, use_reloader=False)
+
+    if not os.getenv("SLIPPA_DEV"):
+        try:
+            from waitress import serve
+        except ImportError:
+            print("⚠️  waitress not installed — falling back to Flask's dev server\n")
+        else:
+            serve(app, host=HOST, port=5000, threads=WEB_THREADS)
+            return
+
+    app.run(debug=True, host=HOST, port=5000, use_reloader=False)
 
 
 if __name__ == "__main__":
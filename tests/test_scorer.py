@@ -9,7 +9,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from slippa.scorer import score_engagement, _label_from_score
+from slippa import scorer
+from slippa.scorer import score_engagement, score_engagement_batch, _label_from_score
 
 
 # ── Test data ──────────────────────────────────────────────────────────
@@ -118,9 +119,41 @@ def test_empty_input():
 
     zero_dur = score_engagement("Some text", 0.0, 1)
     assert zero_dur["total"] == 0.0
+
+    blank = score_engagement("  \n\t ", 10.0, 1)
+    assert blank["total"] == 0.0
     print("  Empty inputs handled correctly")
 
 
+def test_batch_matches_single():
+    """Batch scoring should give the same results as one-by-one scoring."""
+    texts = [ENGAGING_TEXT, BLAND_TEXT, ENGAGING_TEXT + BLAND_TEXT, ""]
+    durations = [30.0, 30.0, 60.0, 10.0]
+    seg_counts = [5, 5, 10, 1]
+
+    # Clear the result cache before each pass, so neither is served from
+    # results the other (or an earlier test) computed
+    scorer._RESULT_CACHE.clear()
+    batch = score_engagement_batch(texts, durations, seg_counts)
+    scorer._RESULT_CACHE.clear()
+    single = [score_engagement(t, d, c) for t, d, c in zip(texts, durations, seg_counts)]
+
+    assert batch == single
+    print(f"  Batch OK: {len(batch)} results")
+
+
+def test_cached_results_are_independent():
+    """Repeat calls hit the result cache but return separate dicts."""
+    first = score_engagement(VIRAL_TEXT, 30.0, 5)
+    first["total"] = -1.0
+    first["breakdown"]["engagement_details"]["hooks"] = -1
+
+    second = score_engagement(VIRAL_TEXT, 30.0, 5)
+    assert second["total"] >= 0
+    assert second["breakdown"]["engagement_details"]["hooks"] >= 0
+    print("  Cached results OK")
+
+
 def test_labels():
     """Label thresholds should be correct."""
     assert _label_from_score(8.0) == "🔥 Viral"
@@ -170,6 +203,73 @@ def test_clipper_integration():
     print(f"  Legacy mode OK: {len(legacy_clips)} clips")
 
 
+def test_clip_duration_window():
+    """Clips should respect min/max duration and carry their full text."""
+    from slippa.clipper import find_clips
+
+    segments = [
+        {"start": i * 5.0, "end": i * 5.0 + 5.0, "text": f"segment {i} words", "words": []}
+        for i in range(20)
+    ]
+
+    clips = find_clips(
+        segments,
+        min_duration=15,
+        max_duration=30,
+        max_clips=10,
+        smart_scoring=False,
+    )
+
+    assert len(clips) > 0, "Should find at least one clip"
+    for clip in clips:
+        duration = clip["end"] - clip["start"]
+        assert 15 <= duration <= 30, f"Duration {duration} outside window"
+        first = int(clip["start"] // 5)
+        last = int(clip["end"] // 5) - 1
+        expected = " ".join(f"segment {k} words" for k in range(first, last + 1))
+        assert clip["text"] == expected
+    print(f"  Duration window OK: {len(clips)} clips")
+
+
+def test_clip_duration_float_boundaries():
+    """Durations that round just outside the limits must be excluded."""
+    from slippa.clipper import find_clips
+
+    # 68.1 - 53.1 == 14.999999999999993, though 53.1 + 15 == 68.1
+    short = [{"start": 53.1, "end": 68.1, "text": "just too short", "words": []}]
+    assert find_clips(short, min_duration=15, max_duration=90, smart_scoring=False) == []
+
+    # 32.2 - 2.2 == 30.000000000000004, though 2.2 + 30 == 32.2
+    long = [{"start": 2.2, "end": 32.2, "text": "just too long", "words": []}]
+    assert find_clips(long, min_duration=15, max_duration=30, smart_scoring=False) == []
+    print("  Float boundaries OK")
+
+
+def test_smart_scoring_fills_max_clips():
+    """Smart scoring should return max_clips clips when that many disjoint windows exist."""
+    from slippa.clipper import find_clips
+
+    # 40 x 3s = 120s of speech: room for 3 disjoint clips of up to 40s.
+    # The densest windows all overlap, so a fixed shortlist finds fewer.
+    segments = [
+        {"start": i * 3.0, "end": i * 3.0 + 3.0, "text": f"segment {i} has some words", "words": []}
+        for i in range(40)
+    ]
+
+    for max_clips in (2, 3):
+        clips = find_clips(
+            segments,
+            min_duration=15,
+            max_duration=45,
+            max_clips=max_clips,
+            smart_scoring=True,
+        )
+        assert len(clips) == max_clips, f"Got {len(clips)} clips, wanted {max_clips}"
+        for a, b in zip(clips, clips[1:]):
+            assert a["end"] <= b["start"], "Clips should not overlap"
+    print("  Smart scoring fills max_clips OK")
+
+
 if __name__ == "__main__":
     tests = [
         ("Engaging beats Bland", test_engaging_beats_bland),
@@ -177,8 +277,13 @@ if __name__ == "__main__":
         ("Viral beats Boring", test_viral_beats_boring),
         ("Score Structure", test_score_structure),
         ("Empty Input", test_empty_input),
+        ("Batch Matches Single", test_batch_matches_single),
+        ("Cached Results Independent", test_cached_results_are_independent),
         ("Labels", test_labels),
         ("Clipper Integration", test_clipper_integration),
+        ("Clip Duration Window", test_clip_duration_window),
+        ("Clip Duration Float Boundaries", test_clip_duration_float_boundaries),
+        ("Smart Scoring Fills Max Clips", test_smart_scoring_fills_max_clips),
     ]
 
     passed = 0